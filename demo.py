@@ -10,6 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from rdbms import Database, Column, Integer, VarChar, Date, Boolean, Float, SQLParser
+from rdbms.repl import format_table
 from datetime import date
 
 
@@ -26,28 +27,9 @@ def print_results(results):
         print("  (0 rows)")
         return
     
-    # Get column names
-    columns = list(results[0].keys())
-    
-    # Calculate column widths
-    widths = {col: len(col) for col in columns}
-    for row in results:
-        for col in columns:
-            val = str(row[col]) if row[col] is not None else "NULL"
-            widths[col] = max(widths[col], len(val))
-    
-    # Print header
-    header = " | ".join(col.ljust(widths[col]) for col in columns)
-    print("\n  " + header)
-    print("  " + "-" * len(header))
-    
-    # Print rows
-    for row in results:
-        values = []
-        for col in columns:
-            val = str(row[col]) if row[col] is not None else "NULL"
-            values.append(val.ljust(widths[col]))
-        print("  " + " | ".join(values))
+    print()
+    for line in format_table(results):
+        print("  " + line)
     
     print(f"\n  ({len(results)} row{'s' if len(results) != 1 else ''})")
 
@@ -4,8 +4,9 @@ Simple Relational Database Management System (RDBMS)
 from .database import Database
 from .table import Table, Column
 from .data_types import Integer, VarChar, Float, Boolean, Date
+from .predicate import Predicate, CompoundPredicate
 from .sql_parser import SQLParser
 from .repl import REPL
 
 __version__ = "1.0.0"
-__all__ = ['Database', 'Table', 'Column', 'Integer', 'VarChar', 'Float', 'Boolean', 'Date', 'SQLParser', 'REPL']
+__all__ = ['Database', 'Table', 'Column', 'Integer', 'VarChar', 'Float', 'Boolean', 'Date', 'Predicate', 'CompoundPredicate', 'SQLParser', 'REPL']
@@ -2,12 +2,17 @@
 Data type definitions for the RDBMS.
 """
 from datetime import date
-from typing import Any, Union
+from typing import Any, Callable, Optional, Union
 
 
 class DataType:
     """Base class for all data types."""
     
+    # Values of exactly this Python type are already in their cast form
+    python_type: Optional[type] = None
+    # SQL spelling of the type, as shown to users and saved to disk
+    type_str = ""
+    
     def __init__(self, nullable=True):
         self.nullable = nullable
     
@@ -32,19 +37,43 @@ class DataType:
     def _cast_value(self, value: Any) -> Any:
         """Override in subclasses to implement type-specific casting."""
         raise NotImplementedError
+    
+    def make_caster(self) -> Callable[[Any], Any]:
+        """Return a cast function specialized to this type's current settings.
+        
+        Equivalent to ``cast``, but values already of ``python_type`` are
+        returned without going through method dispatch.
+        """
+        exact_type = self.python_type
+        nullable = self.nullable
+        cast_value = self._cast_value
+        
+        def cast(value):
+            if type(value) is exact_type:
+                return value
+            if value is None:
+                if not nullable:
+                    raise ValueError("NULL value not allowed for non-nullable column")
+                return None
+            return cast_value(value)
+        
+        return cast
+    
+    def __repr__(self):
+        return self.type_str
 
 
 class Integer(DataType):
     """Integer data type."""
     
+    python_type = int
+    type_str = "INTEGER"
+    
     def _validate_value(self, value: Any) -> bool:
         return isinstance(value, int) and not isinstance(value, bool)
     
     def _cast_value(self, value: Any) -> int:
         return int(value)
-    
-    def __repr__(self):
-        return "INTEGER"
 
 
 class VarChar(DataType):
@@ -53,6 +82,7 @@ class VarChar(DataType):
     def __init__(self, max_length=255, nullable=True):
         super().__init__(nullable)
         self.max_length = max_length
+        self.type_str = f"VARCHAR({max_length})"
     
     def _validate_value(self, value: Any) -> bool:
         return isinstance(value, str) and len(value) <= self.max_length
@@ -63,26 +93,37 @@ class VarChar(DataType):
             raise ValueError(f"String length {len(result)} exceeds max length {self.max_length}")
         return result
     
-    def __repr__(self):
-        return f"VARCHAR({self.max_length})"
+    def make_caster(self) -> Callable[[Any], Any]:
+        max_length = self.max_length
+        generic_cast = super().make_caster()
+        
+        def cast(value):
+            if type(value) is str and len(value) <= max_length:
+                return value
+            return generic_cast(value)
+        
+        return cast
 
 
 class Float(DataType):
     """Floating point number."""
     
+    python_type = float
+    type_str = "FLOAT"
+    
     def _validate_value(self, value: Any) -> bool:
         return isinstance(value, (int, float)) and not isinstance(value, bool)
     
     def _cast_value(self, value: Any) -> float:
         return float(value)
-    
-    def __repr__(self):
-        return "FLOAT"
 
 
 class Boolean(DataType):
     """Boolean data type."""
     
+    python_type = bool
+    type_str = "BOOLEAN"
+    
     def _validate_value(self, value: Any) -> bool:
         return isinstance(value, bool)
     
@@ -92,14 +133,14 @@ class Boolean(DataType):
         if isinstance(value, str):
             return value.lower() in ('true', '1', 'yes')
         return bool(value)
-    
-    def __repr__(self):
-        return "BOOLEAN"
 
 
 class Date(DataType):
     """Date data type."""
     
+    python_type = date
+    type_str = "DATE"
+    
     def _validate_value(self, value: Any) -> bool:
         return isinstance(value, date)
     
@@ -108,11 +149,8 @@ class Date(DataType):
             return value
         if isinstance(value, str):
             # Parse ISO format YYYY-MM-DD
-            parts = value.split('-')
-            if len(parts) != 3:
-                raise ValueError(f"Invalid date format: {value}")
-            return date(int(parts[0]), int(parts[1]), int(parts[2]))
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f"Invalid date format: {value}") from None
         raise ValueError(f"Cannot cast {type(value)} to DATE")
-    
-    def __repr__(self):
-        return "DATE"
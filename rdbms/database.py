@@ -1,10 +1,56 @@
 """
 Database management and storage.
 """
-from typing import Dict, Optional, List, Any
+from collections import defaultdict
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Optional, List, Any, Tuple, Iterable, Iterator
+from datetime import date
 from .table import Table, Column
+from .index import Index
+from .data_types import Float
 import json
+import math
 import os
+import re
+
+try:
+    import orjson
+except ImportError:  # optional, faster serializer
+    orjson = None
+
+
+# Joins where both sides have an index on the join column and at least this
+# many rows use a sort-merge join over the index entries
+MERGE_JOIN_MIN_ROWS = 1000
+
+# Rows serialized per write when saving, bounding how much encoded output
+# is held in memory at once
+SAVE_CHUNK_ROWS = 1000
+
+# orjson reads integers outside the 64-bit range as floats, losing
+# precision; files that may hold one (any long run of digits) are loaded
+# with the json module instead
+_WIDE_INT = re.compile(rb'\d{20}|-\d{19}')
+
+
+class DBEncoder(json.JSONEncoder):
+    """JSON encoder for database state; only called for non-JSON values."""
+    
+    def default(self, o):
+        if isinstance(o, date):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _has_non_finite(rows: List[Dict[str, Any]], columns: List[str]) -> bool:
+    """Check whether any row holds an infinite or NaN value in these FLOAT columns."""
+    for col_name in columns:
+        # A sum is finite only if every value is; one that merely overflows
+        # is a harmless false positive
+        if not math.isfinite(sum(row[col_name] or 0.0 for row in rows)):
+            return True
+    return False
 
 
 class Database:
@@ -57,6 +103,16 @@ class Database:
         Returns:
             List of joined rows
         """
+        return list(self.iter_join(left_table_name, right_table_name,
+                                   left_column, right_column,
+                                   join_type=join_type,
+                                   select_columns=select_columns))
+    
+    def iter_join(self, left_table_name: str, right_table_name: str,
+                  left_column: str, right_column: str,
+                  join_type: str = "inner",
+                  select_columns: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Like join(), but yields joined rows one at a time instead of building a list."""
         left_table = self.get_table(left_table_name)
         right_table = self.get_table(right_table_name)
         
@@ -65,93 +121,212 @@ class Database:
         if right_column not in right_table.columns:
             raise ValueError(f"Column {right_column} not in table {right_table_name}")
         
-        # Build index on right table for faster lookup
-        right_index = {}
-        for row in right_table.rows:
-            key = row[right_column]
-            if key not in right_index:
-                right_index[key] = []
-            right_index[key].append(row)
+        is_left_join = join_type.lower() == "left"
+        
+        # Pick the join algorithm
+        left_index = left_table.indexes.get(left_column)
+        right_index = right_table.indexes.get(right_column)
+        pairs = None
+        if (left_index is not None and right_index is not None and
+                min(left_table.row_count, right_table.row_count) >= MERGE_JOIN_MIN_ROWS):
+            pairs = self._merge_join_pairs(left_index, right_index, is_left_join)
+        if pairs is None:
+            pairs = self._hash_join_pairs(left_table, right_table, left_column, right_column, is_left_join)
+        
+        return self._join_rows(pairs, left_table, right_table, select_columns)
+    
+    def _join_rows(self, pairs: Iterable[Tuple[int, Optional[int]]],
+                   left_table: Table, right_table: Table,
+                   select_columns: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        """Yield output rows for (left row ID, right row ID) pairs."""
+        # Qualified output keys are cached on the tables, not built per row
+        joined_keys = left_table.qualified_names + right_table.qualified_names
+        # Each row's values are read from the column lists as its pair comes
+        # up, so nothing is built for rows not yet reached
+        left_cols = [left_table.columns_data[c] for c in left_table.column_order]
+        right_cols = [right_table.columns_data[c] for c in right_table.column_order]
+        null_right = [None] * len(right_cols)
         
-        result = []
+        if select_columns:
+            # Resolve projected columns to row positions once; unknown
+            # columns read the trailing NULL appended to each joined row
+            keys = tuple(select_columns)
+            positions = {key: pos for pos, key in enumerate(joined_keys)}
+            missing = len(joined_keys)
+            picks = [positions.get(key, missing) for key in keys]
+            # One extra pick keeps itemgetter returning a tuple even for a
+            # single column; zip() stops at the last key and ignores it
+            pick = itemgetter(*picks, missing)
+            null_tail = [None]
+            for left_id, right_id in pairs:
+                right_row = null_right if right_id is None else [col[right_id] for col in right_cols]
+                yield dict(zip(keys, pick([col[left_id] for col in left_cols] + right_row + null_tail)))
+        else:
+            for left_id, right_id in pairs:
+                right_row = null_right if right_id is None else [col[right_id] for col in right_cols]
+                yield dict(zip(joined_keys, [col[left_id] for col in left_cols] + right_row))
+    
+    def _hash_join_pairs(self, left_table: Table, right_table: Table,
+                         left_column: str, right_column: str,
+                         is_left_join: bool) -> Iterator[Tuple[int, Optional[int]]]:
+        """Match rows with a hash join; yields (left row ID, right row ID) pairs."""
+        # Build index on right table for faster lookup.
+        # NULL keys never compare equal, so they are left out.
+        right_index = defaultdict(list)
+        right_deleted = right_table.deleted
+        for row_id, key in enumerate(right_table.columns_data[right_column]):
+            if key is None or row_id in right_deleted:
+                continue
+            right_index[key].append(row_id)
         
-        for left_row in left_table.rows:
-            key = left_row[left_column]
-            matches = right_index.get(key, [])
+        left_deleted = left_table.deleted
+        for left_id, key in enumerate(left_table.columns_data[left_column]):
+            if left_id in left_deleted:
+                continue
+            matches = right_index.get(key)
             
             if matches:
                 # Found matching rows
-                for right_row in matches:
-                    joined_row = {}
-                    # Add left table columns
-                    for col_name, value in left_row.items():
-                        joined_row[f"{left_table_name}.{col_name}"] = value
-                    # Add right table columns
-                    for col_name, value in right_row.items():
-                        joined_row[f"{right_table_name}.{col_name}"] = value
-                    result.append(joined_row)
-            elif join_type.lower() == "left":
+                for right_id in matches:
+                    yield left_id, right_id
+            elif is_left_join:
                 # Left join: include left row with NULL for right columns
-                joined_row = {}
-                for col_name, value in left_row.items():
-                    joined_row[f"{left_table_name}.{col_name}"] = value
-                for col_name in right_table.columns:
-                    joined_row[f"{right_table_name}.{col_name}"] = None
-                result.append(joined_row)
-        
-        # Filter columns if specified
-        if select_columns:
-            result = [
-                {col: row.get(col) for col in select_columns}
-                for row in result
-            ]
+                yield left_id, None
+    
+    def _merge_join_pairs(self, left_index: Index, right_index: Index,
+                          is_left_join: bool) -> Optional[List[Tuple[int, Optional[int]]]]:
+        """Match rows by merging the key-ordered entries of two indexes.
+        
+        Returns (left row ID, right row ID) pairs, or None if the join keys
+        cannot be ordered (mixed types), in which case a hash join is used.
+        """
+        try:
+            left_items = left_index.sorted_items()
+            right_items = right_index.sorted_items()
+        except TypeError:
+            return None
         
-        return result
+        pairs = []
+        i = j = 0
+        while i < len(left_items) and j < len(right_items):
+            left_key, left_ids = left_items[i]
+            right_key, right_ids = right_items[j]
+            try:
+                if left_key == right_key:
+                    for left_id in left_ids:
+                        for right_id in right_ids:
+                            pairs.append((left_id, right_id))
+                    i += 1
+                    j += 1
+                    continue
+                left_behind = left_key < right_key
+            except TypeError:
+                return None
+            if left_behind:
+                if is_left_join:
+                    pairs.extend((left_id, None) for left_id in left_ids)
+                i += 1
+            else:
+                j += 1
+        
+        if is_left_join:
+            for left_key, left_ids in left_items[i:]:
+                pairs.extend((left_id, None) for left_id in left_ids)
+            # NULL keys never match but still appear in a left join
+            pairs.extend((left_id, None) for left_id in sorted(left_index.lookup(None)))
+        
+        return pairs
     
     def save(self, filepath: str):
-        """Save database to a JSON file."""
-        data = {
-            "name": self.name,
-            "tables": {}
-        }
-        
-        for table_name, table in self.tables.items():
-            table_data = {
-                "columns": [
-                    {
-                        "name": col.name,
-                        "type": str(col.data_type),
-                        "nullable": col.data_type.nullable,
-                        "primary_key": col.primary_key,
-                        "unique": col.unique
-                    }
-                    for col in [table.columns[name] for name in table.column_order]
-                ],
-                "rows": []
-            }
-            
-            # Serialize rows
-            for row in table.rows:
-                serialized_row = {}
-                for col_name, value in row.items():
-                    if value is None:
-                        serialized_row[col_name] = None
-                    elif hasattr(value, 'isoformat'):  # Date
-                        serialized_row[col_name] = value.isoformat()
-                    else:
-                        serialized_row[col_name] = value
-                table_data["rows"].append(serialized_row)
+        """Save database to a JSON file.
+        
+        The file is written incrementally, table by table and rows in
+        chunks, so the whole database is never encoded into one string.
+        """
+        # Unindented, so the json module can use its C encoder; with
+        # indent it falls back to a much slower pure-Python one
+        json_encode = DBEncoder().encode
+        if orjson is not None:
+            # orjson handles dates natively; default is only a safety net
+            default = DBEncoder().default
             
-            data["tables"][table_name] = table_data
+            def encode(obj, float_cols=()) -> bytes:
+                # orjson writes inf and NaN as null; json keeps them as
+                # Infinity and NaN
+                if float_cols and _has_non_finite(obj, float_cols):
+                    return json_encode(obj).encode()
+                try:
+                    return orjson.dumps(obj, default=default)
+                except orjson.JSONEncodeError:
+                    # e.g. integers wider than 64 bits, which json handles
+                    return json_encode(obj).encode()
+        else:
+            def encode(obj, float_cols=()) -> bytes:
+                return json_encode(obj).encode()
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Written to a temporary file that replaces the old one only once
+        # complete, so a failed save leaves the previous file intact
+        temp_path = f"{filepath}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(b'{"name":' + encode(self.name) + b',"tables":{')
+                for position, (table_name, table) in enumerate(self.tables.items()):
+                    columns = [
+                        {
+                            "name": col.name,
+                            "type": col.data_type.type_str,
+                            "nullable": col.data_type.nullable,
+                            "primary_key": col.primary_key,
+                            "unique": col.unique
+                        }
+                        for col in [table.columns[name] for name in table.column_order]
+                    ]
+                    if position:
+                        f.write(b',')
+                    f.write(encode(table_name) + b':{"columns":' + encode(columns))
+                    if table.max_pk is not None:
+                        f.write(b',"max_pk":' + encode(table.max_pk))
+                    f.write(b',"rows":[')
+                    
+                    float_cols = [
+                        name for name in table.column_order
+                        if isinstance(table.columns[name].data_type, Float)
+                    ]
+                    
+                    # Each chunk is encoded as a list and written without its
+                    # brackets, joined to the previous chunk by a comma
+                    rows = iter(table.rows)
+                    first = True
+                    while True:
+                        chunk = list(islice(rows, SAVE_CHUNK_ROWS))
+                        if not chunk:
+                            break
+                        if not first:
+                            f.write(b',')
+                        f.write(encode(chunk, float_cols)[1:-1])
+                        first = False
+                    f.write(b']}')
+                f.write(b'}}')
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
     
     @classmethod
     def load(cls, filepath: str) -> 'Database':
         """Load database from a JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        data = None
+        if orjson is not None and not _WIDE_INT.search(raw):
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # e.g. Infinity or NaN, which only json reads
+                pass
+        if data is None:
+            data = json.loads(raw)
         
         db = cls(data["name"])
         
@@ -187,14 +362,10 @@ class Database:
             
             table = db.create_table(table_name, columns)
             
-            # Insert rows
-            for row_data in table_data["rows"]:
-                # Convert date strings back to date objects
-                for col_name, value in row_data.items():
-                    col = table.columns[col_name]
-                    if isinstance(col.data_type, Date) and value is not None:
-                        row_data[col_name] = col.data_type.cast(value)
-                
-                table.insert(row_data)
+            # Saved rows are trusted: cast them column by column (DATE
+            # strings included) and build the indexes once
+            table.bulk_insert(table_data["rows"])
+            if table.max_pk is not None and "max_pk" in table_data:
+                table.note_max_pk(table_data["max_pk"])
         
         return db
@@ -1,7 +1,7 @@
 """
 Index implementation for fast lookups.
 """
-from typing import Any, List, Dict, Optional
+from typing import Any, FrozenSet, Iterable, List, Dict, Optional, Set, Tuple, Union
 
 
 class Index:
@@ -10,31 +10,88 @@ class Index:
     def __init__(self, column_name: str, unique: bool = False):
         self.column_name = column_name
         self.unique = unique
-        # Map from value to list of row IDs
-        self.index: Dict[Any, List[int]] = {}
+        # Map from value to its row IDs. A value held by a single row (always
+        # the case for unique columns) stores the bare row ID rather than a
+        # one-element set, which keeps unique indexes small.
+        self.index: Dict[Any, Union[int, Set[int]]] = {}
+        # Cached result of sorted_items(), dropped whenever the index changes
+        self._sorted_items: Optional[List[Tuple[Any, Tuple[int, ...]]]] = None
     
     def add(self, value: Any, row_id: int):
         """Add a value to the index."""
-        if value not in self.index:
-            self.index[value] = []
-        self.index[value].append(row_id)
+        self._sorted_items = None
+        row_ids = self.index.get(value)
+        if row_ids is None:
+            self.index[value] = row_id
+        elif type(row_ids) is int:
+            self.index[value] = {row_ids, row_id}
+        else:
+            row_ids.add(row_id)
+    
+    def add_many(self, values: List[Any], row_ids: Iterable[int]):
+        """Add values for several rows, pairing values and row IDs in order."""
+        self._sorted_items = None
+        index = self.index
+        for value, row_id in zip(values, row_ids):
+            existing = index.get(value)
+            if existing is None:
+                index[value] = row_id
+            elif type(existing) is int:
+                index[value] = {existing, row_id}
+            else:
+                existing.add(row_id)
     
     def remove(self, value: Any, row_id: int):
         """Remove a value from the index."""
-        if value in self.index:
-            if row_id in self.index[value]:
-                self.index[value].remove(row_id)
-            if not self.index[value]:
+        self._sorted_items = None
+        row_ids = self.index.get(value)
+        if row_ids is None:
+            return
+        if type(row_ids) is int:
+            if row_ids == row_id:
                 del self.index[value]
+            return
+        row_ids.discard(row_id)
+        if len(row_ids) == 1:
+            self.index[value] = row_ids.pop()
+        elif not row_ids:
+            del self.index[value]
+    
+    def rebuild(self, values: List[Any], deleted: Optional[Set[int]] = None):
+        """Rebuild the index from a column's values, where row ID is the position."""
+        self.index = {}
+        self._sorted_items = None
+        for row_id, value in enumerate(values):
+            if not deleted or row_id not in deleted:
+                self.add(value, row_id)
+    
+    def __contains__(self, value: Any) -> bool:
+        """Check whether any row holds this value, without building a set."""
+        return value in self.index
+    
+    def lookup(self, value: Any) -> FrozenSet[int]:
+        """Look up row IDs by value.
+        
+        The result is a frozen copy, so callers can neither change the index
+        through it nor see it change when rows are later added or removed.
+        """
+        row_ids = self.index.get(value)
+        if row_ids is None:
+            return frozenset()
+        if type(row_ids) is int:
+            return frozenset((row_ids,))
+        return frozenset(row_ids)
     
-    def lookup(self, value: Any) -> List[int]:
-        """Look up row IDs by value."""
-        return self.index.get(value, [])
-    
-    def shift_after(self, deleted_row_id: int):
-        """Shift row IDs after a deletion."""
-        for value, row_ids in self.index.items():
-            self.index[value] = [
-                row_id - 1 if row_id > deleted_row_id else row_id
-                for row_id in row_ids
-            ]
+    def sorted_items(self) -> List[Tuple[Any, Tuple[int, ...]]]:
+        """Return (value, row IDs) pairs ordered by value, excluding NULL.
+        
+        The result is cached until the index changes. Raises TypeError if
+        the indexed values cannot be ordered.
+        """
+        if self._sorted_items is None:
+            self._sorted_items = sorted(
+                (value, (row_ids,) if type(row_ids) is int else tuple(sorted(row_ids)))
+                for value, row_ids in self.index.items()
+                if value is not None
+            )
+        return self._sorted_items
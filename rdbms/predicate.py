@@ -0,0 +1,86 @@
+"""
+WHERE clause predicates.
+"""
+from typing import Any, Callable, Dict, List
+from .scan import scan_column
+
+
+# Each entry builds a closure specialized to one operator and constant,
+# so evaluating a value needs no operator dispatch. NULLs never satisfy
+# an ordering comparison.
+_COMPILERS: Dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    '=': lambda const: lambda value: value == const,
+    '!=': lambda const: lambda value: value != const,
+    '<>': lambda const: lambda value: value != const,
+    '<': lambda const: lambda value: value is not None and value < const,
+    '>': lambda const: lambda value: value is not None and value > const,
+    '<=': lambda const: lambda value: value is not None and value <= const,
+    '>=': lambda const: lambda value: value is not None and value >= const,
+}
+
+
+# Rough selectivity rank of each operator: equality usually matches the
+# fewest rows, inequality the most
+_SELECTIVITY = {'=': 0, '<': 1, '>': 1, '<=': 1, '>=': 1, '!=': 2, '<>': 2}
+
+
+class Predicate:
+    """A single ``column <operator> value`` condition."""
+    
+    __slots__ = ('column', 'operator', 'value', 'test')
+    
+    def __init__(self, column: str, operator: str, value: Any):
+        if operator not in _COMPILERS:
+            raise ValueError(f"Unsupported operator: {operator}")
+        self.column = column
+        self.operator = operator
+        self.value = value
+        # Compiled once and reused for every row and every execution
+        self.test = _COMPILERS[operator](value)
+    
+    def __call__(self, row: Dict[str, Any]) -> bool:
+        """Evaluate the predicate against a row dict."""
+        return self.test(row[self.column])
+    
+    def scan(self, values: List[Any]) -> List[int]:
+        """Return the positions in a column whose values match."""
+        return scan_column(values, self.operator, self.value)
+    
+    def __repr__(self):
+        return f"Predicate({self.column!r}, {self.operator!r}, {self.value!r})"
+
+
+class CompoundPredicate:
+    """Predicates combined with AND or OR.
+    
+    AND children are reordered so the likely most selective predicates
+    run first; other callables keep their relative order, after them.
+    """
+    
+    __slots__ = ('kind', 'children', '_combine')
+    
+    def __init__(self, kind: str, children: List[Any]):
+        kind = kind.upper()
+        if kind not in ('AND', 'OR'):
+            raise ValueError(f"Unsupported compound predicate: {kind}")
+        self.kind = kind
+        self.children = list(children)
+        if kind == 'AND':
+            self.children.sort(key=_selectivity)
+        # Resolved once rather than re-checking the kind for every row
+        self._combine = all if kind == 'AND' else any
+    
+    def __call__(self, row: Dict[str, Any]) -> bool:
+        """Evaluate the predicate against a row dict, short-circuiting."""
+        return self._combine(child(row) for child in self.children)
+    
+    def __repr__(self):
+        return f"CompoundPredicate({self.kind!r}, {self.children!r})"
+
+
+def _selectivity(condition: Any) -> int:
+    """Sort key placing selective predicates first within an AND."""
+    if isinstance(condition, Predicate):
+        return _SELECTIVITY[condition.operator]
+    # Anything else (nested compounds, plain callables) runs last
+    return 3
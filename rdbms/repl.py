@@ -2,10 +2,29 @@
 Interactive REPL for the RDBMS.
 """
 import sys
+from typing import Any, Dict, List
 from .database import Database
 from .sql_parser import SQLParser
 
 
+_EXIT_COMMANDS = frozenset({'exit', 'quit'})
+
+
+def format_table(rows: List[Dict[str, Any]]) -> List[str]:
+    """Format result rows as text lines: header, separator, then one line per row."""
+    columns = list(rows[0].keys())
+    
+    # Stringify each cell once; widths and output both reuse the strings
+    cells = [["NULL" if row[col] is None else str(row[col]) for row in rows] for col in columns]
+    widths = [max(len(col), max(map(len, col_cells))) for col, col_cells in zip(columns, cells)]
+    
+    header = " | ".join(col.ljust(width) for col, width in zip(columns, widths))
+    lines = [header, "-" * len(header)]
+    for row_cells in zip(*cells):
+        lines.append(" | ".join(cell.ljust(width) for cell, width in zip(row_cells, widths)))
+    return lines
+
+
 class REPL:
     """Interactive REPL for executing SQL commands."""
     
@@ -32,19 +51,20 @@ class REPL:
                     continue
                 
                 # Handle special commands
-                if sql.lower() in ('exit', 'quit'):
+                command = sql.lower()
+                if command in _EXIT_COMMANDS:
                     print("Goodbye!")
                     break
                 
-                if sql.lower() == 'help':
+                if command == 'help':
                     self._print_help()
                     continue
                 
-                if sql.lower() == 'tables':
+                if command == 'tables':
                     self._list_tables()
                     continue
                 
-                if sql.lower().startswith('describe '):
+                if command.startswith('describe '):
                     table_name = sql.split()[1]
                     self._describe_table(table_name)
                     continue
@@ -139,30 +159,9 @@ class REPL:
             print("(0 rows)")
             return
         
-        # Get column names
-        columns = list(rows[0].keys())
-        
-        # Calculate column widths
-        widths = {}
-        for col in columns:
-            widths[col] = len(col)
-            for row in rows:
-                val = str(row[col]) if row[col] is not None else "NULL"
-                widths[col] = max(widths[col], len(val))
-        
-        # Print header
         print()
-        header = " | ".join(col.ljust(widths[col]) for col in columns)
-        print(header)
-        print("-" * len(header))
-        
-        # Print rows
-        for row in rows:
-            values = []
-            for col in columns:
-                val = str(row[col]) if row[col] is not None else "NULL"
-                values.append(val.ljust(widths[col]))
-            print(" | ".join(values))
+        for line in format_table(rows):
+            print(line)
         
         print(f"\n({len(rows)} row{'s' if len(rows) != 1 else ''})")
 
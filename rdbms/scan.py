@@ -0,0 +1,67 @@
+"""
+Column scan kernels for WHERE filtering.
+"""
+import operator
+from typing import Any, Callable, Dict, List
+
+
+# One kernel per operator, with the comparison written inline: the
+# interpreter then specializes it for the column's value type, which is
+# faster than dispatching through an operator function per value.
+
+def _scan_eq(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value == const]
+
+
+def _scan_ne(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value != const]
+
+
+def _scan_lt(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value < const]
+
+
+def _scan_gt(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value > const]
+
+
+def _scan_le(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value <= const]
+
+
+def _scan_ge(values: List[Any], const: Any) -> List[int]:
+    return [row_id for row_id, value in enumerate(values) if value >= const]
+
+
+_KERNELS: Dict[str, Callable[[List[Any], Any], List[int]]] = {
+    '=': _scan_eq,
+    '!=': _scan_ne,
+    '<>': _scan_ne,
+    '<': _scan_lt,
+    '>': _scan_gt,
+    '<=': _scan_le,
+    '>=': _scan_ge,
+}
+
+_OPERATORS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<>': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+
+def scan_column(values: List[Any], op: str, const: Any) -> List[int]:
+    """Return the positions in a column where ``value <op> const`` holds."""
+    try:
+        return _KERNELS[op](values, const)
+    except TypeError:
+        # NULLs cannot be ordered; they never match a comparison
+        compare = _OPERATORS[op]
+        return [
+            row_id for row_id, value in enumerate(values)
+            if value is not None and compare(value, const)
+        ]
@@ -2,59 +2,185 @@
 SQL parser for the RDBMS.
 """
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from .database import Database
-from .table import Column
+from .table import Table, Column
+from .predicate import Predicate, CompoundPredicate
 from .data_types import Integer, VarChar, Float, Boolean, Date
 
 
+# Maximum number of prepared plans kept by each parser
+PLAN_CACHE_SIZE = 256
+
+# Literal keywords and the values they stand for
+_LITERALS = {'NULL': None, 'TRUE': True, 'FALSE': False}
+
+# Column type names (other than VARCHAR) and their data type classes
+_TYPES = {
+    'INTEGER': Integer,
+    'INT': Integer,
+    'FLOAT': Float,
+    'BOOLEAN': Boolean,
+    'BOOL': Boolean,
+    'DATE': Date,
+}
+
+# Statement kinds keyed by leading keyword, or by the first two keywords
+# where the first one alone is ambiguous
+_STATEMENTS = {
+    'SELECT': 'select',
+    'UPDATE': 'update',
+    ('CREATE', 'TABLE'): 'create_table',
+    ('CREATE', 'INDEX'): 'create_index',
+    ('CREATE', 'UNIQUE'): 'create_index',
+    ('DROP', 'TABLE'): 'drop_table',
+    ('INSERT', 'INTO'): 'insert',
+    ('DELETE', 'FROM'): 'delete',
+}
+
+# Statement patterns, compiled once at import
+_RE_CREATE_TABLE = re.compile(r'CREATE\s+TABLE\s+(\w+)\s*\((.*)\)', re.IGNORECASE | re.DOTALL)
+_RE_VARCHAR_LEN = re.compile(r'VARCHAR\((\d+)\)')
+_RE_DROP_TABLE = re.compile(r'DROP\s+TABLE\s+(\w+)', re.IGNORECASE)
+_RE_INSERT = re.compile(
+    r'INSERT\s+INTO\s+(\w+)\s*\((.*?)\)\s*VALUES\s*(.*)',
+    re.IGNORECASE | re.DOTALL
+)
+# One parenthesized row of an INSERT's VALUES list, and the comma after it
+_RE_INSERT_ROW = re.compile(r'''\(((?:'[^']*'|"[^"]*"|[^'"()])*)\)\s*(?:,\s*)?''')
+_RE_SELECT = re.compile(
+    r'SELECT\s+(.*?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.*))?',
+    re.IGNORECASE | re.DOTALL
+)
+_RE_SELECT_JOIN = re.compile(
+    r'SELECT\s+(.*?)\s+FROM\s+(\w+)\s+(LEFT\s+)?JOIN\s+(\w+)\s+ON\s+(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)',
+    re.IGNORECASE
+)
+_RE_JOIN = re.compile(r'\bJOIN\b', re.IGNORECASE)
+_RE_UPDATE = re.compile(
+    r'UPDATE\s+(\w+)\s+SET\s+(.*?)(?:\s+WHERE\s+(.*))?$',
+    re.IGNORECASE | re.DOTALL
+)
+_RE_DELETE = re.compile(r'DELETE\s+FROM\s+(\w+)(?:\s+WHERE\s+(.*))?', re.IGNORECASE)
+_RE_CREATE_INDEX = re.compile(
+    r'CREATE\s+(UNIQUE\s+)?INDEX\s+\w+\s+ON\s+(\w+)\s*\((\w+)\)',
+    re.IGNORECASE
+)
+# Pieces of a VALUES list: a quoted string (unterminated ones run to the
+# end), a run of other text, or a separating comma
+_RE_VALUE_TOKEN = re.compile(r"""'[^']*'?|"[^"]*"?|[^,'"]+|,""")
+# Quoted strings, which are skipped, and AND/OR keywords in a WHERE clause
+_RE_WHERE_SPLIT = re.compile(r"""'[^']*'|"[^"]*"|\s+(AND|OR)\s+""", re.IGNORECASE)
+# Two-character operators come first so that '<=' is not read as '<'
+_RE_WHERE_COND = re.compile(r'(\w+)\s*(<=|>=|!=|<>|=|<|>)\s*(.+)')
+
+
+def _next_keyword(sql: str, pos: int) -> Tuple[str, int]:
+    """Read the word at or after pos; returns it upper-cased and the position after it."""
+    end = len(sql)
+    while pos < end and sql[pos].isspace():
+        pos += 1
+    start = pos
+    while pos < end and (sql[pos].isalpha() or sql[pos] == '_'):
+        pos += 1
+    return sql[start:pos].upper(), pos
+
+
+class PreparedPlan:
+    """A parsed INSERT, SELECT, UPDATE or DELETE bound to its table."""
+    
+    __slots__ = ('kind', 'table', 'columns', 'where', 'updates', 'values')
+    
+    def __init__(self, kind: str, table: Table, columns: Optional[tuple] = None,
+                 where: Optional[Predicate] = None, updates: Optional[tuple] = None,
+                 values: Optional[tuple] = None):
+        self.kind = kind
+        self.table = table
+        self.columns = columns
+        self.where = where
+        self.updates = updates
+        self.values = values
+
+
 class SQLParser:
-    """Simple SQL parser and executor."""
+    """Simple SQL parser and executor.
+    
+    Statements are executed in two steps: the SQL text is parsed into a
+    ``(kind, args)`` statement, which is then run against the database by
+    ``_execute_<kind>(*args)``. Parsing depends only on the text, never on
+    the schema, so parsed statements are cached by SQL text.
+    
+    INSERT, SELECT, UPDATE and DELETE statements are additionally prepared
+    against their table once: ``_prepare_<kind>(*args)`` checks the columns
+    and compiles the WHERE clause into a PreparedPlan, which is kept per
+    parser and run by ``_execute_<kind>(plan)`` on later calls. Both are
+    found through the _PREPARERS and _EXECUTORS tables at the end of the
+    class, so executing a cached plan is one dict lookup and one call.
+    """
     
     def __init__(self, database: Database):
         self.database = database
+        self._plan_cache: OrderedDict = OrderedDict()
     
     def execute(self, sql: str) -> Any:
         """Execute a SQL statement."""
+        # Surrounding whitespace and a trailing semicolon do not change the
+        # statement, so they are dropped before the caches are consulted
         sql = sql.strip()
-        
-        # Remove trailing semicolon
         if sql.endswith(';'):
-            sql = sql[:-1].strip()
-        
-        # Determine statement type
-        sql_upper = sql.upper()
-        
-        if sql_upper.startswith('CREATE TABLE'):
-            return self._execute_create_table(sql)
-        elif sql_upper.startswith('DROP TABLE'):
-            return self._execute_drop_table(sql)
-        elif sql_upper.startswith('INSERT INTO'):
-            return self._execute_insert(sql)
-        elif sql_upper.startswith('SELECT'):
-            return self._execute_select(sql)
-        elif sql_upper.startswith('UPDATE'):
-            return self._execute_update(sql)
-        elif sql_upper.startswith('DELETE FROM'):
-            return self._execute_delete(sql)
-        elif sql_upper.startswith('CREATE INDEX'):
-            return self._execute_create_index(sql)
-        else:
-            raise ValueError(f"Unsupported SQL statement: {sql}")
+            sql = sql[:-1].rstrip()
+        
+        plan = self._plan_cache.get(sql)
+        if plan is not None and self.database.tables.get(plan.table.name) is plan.table:
+            self._plan_cache.move_to_end(sql)
+            return self._EXECUTORS[plan.kind](self, plan)
+        
+        kind, args = self._parse(sql)
+        prepare = self._PREPARERS.get(kind)
+        if prepare is None:
+            return self._EXECUTORS[kind](self, *args)
+        
+        plan = prepare(self, *args)
+        self._plan_cache[sql] = plan
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return self._EXECUTORS[kind](self, plan)
     
-    def _execute_create_table(self, sql: str) -> str:
-        """Execute CREATE TABLE statement."""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse(sql: str) -> Tuple[str, tuple]:
+        """Parse a stripped SQL statement into ``(kind, args)``."""
+        # Determine statement type from the leading keyword(s) only
+        first, pos = _next_keyword(sql, 0)
+        kind = _STATEMENTS.get(first)
+        if kind is None:
+            kind = _STATEMENTS.get((first, _next_keyword(sql, pos)[0]))
+            if kind is None:
+                raise ValueError(f"Unsupported SQL statement: {sql}")
+        
+        # Handle JOIN queries
+        if kind == 'select' and _RE_JOIN.search(sql):
+            kind = 'select_join'
+        
+        return kind, getattr(SQLParser, '_parse_' + kind)(sql)
+    
+    @staticmethod
+    def _parse_create_table(sql: str) -> tuple:
+        """Parse CREATE TABLE into (table_name, column specs)."""
         # Pattern: CREATE TABLE table_name (col1 TYPE, col2 TYPE PRIMARY KEY, ...)
-        match = re.match(r'CREATE TABLE\s+(\w+)\s*\((.*)\)', sql, re.IGNORECASE | re.DOTALL)
+        match = _RE_CREATE_TABLE.match(sql)
         if not match:
             raise ValueError("Invalid CREATE TABLE syntax")
         
         table_name = match.group(1)
         columns_str = match.group(2)
         
-        columns = []
+        column_specs = []
         for col_def in columns_str.split(','):
             col_def = col_def.strip()
+            col_def_upper = col_def.upper()
             parts = col_def.split()
             
             if len(parts) < 2:
@@ -63,29 +189,36 @@ class SQLParser:
             col_name = parts[0]
             col_type_str = parts[1].upper()
             
-            # Parse data type
+            # Parse data type; VARCHAR carries its max length (None for default)
+            max_len = None
             if col_type_str.startswith('VARCHAR'):
-                match = re.match(r'VARCHAR\((\d+)\)', col_type_str)
+                match = _RE_VARCHAR_LEN.match(col_type_str)
                 if match:
                     max_len = int(match.group(1))
-                    data_type = VarChar(max_len)
-                else:
-                    data_type = VarChar()
-            elif col_type_str == 'INTEGER' or col_type_str == 'INT':
-                data_type = Integer()
-            elif col_type_str == 'FLOAT':
-                data_type = Float()
-            elif col_type_str == 'BOOLEAN' or col_type_str == 'BOOL':
-                data_type = Boolean()
-            elif col_type_str == 'DATE':
-                data_type = Date()
+                type_name = 'VARCHAR'
+            elif col_type_str in _TYPES:
+                type_name = col_type_str
             else:
                 raise ValueError(f"Unsupported data type: {col_type_str}")
             
             # Check for constraints
-            primary_key = 'PRIMARY KEY' in col_def.upper()
-            unique = 'UNIQUE' in col_def.upper()
-            not_null = 'NOT NULL' in col_def.upper()
+            primary_key = 'PRIMARY KEY' in col_def_upper
+            unique = 'UNIQUE' in col_def_upper
+            not_null = 'NOT NULL' in col_def_upper
+            
+            column_specs.append((col_name, type_name, max_len, primary_key, unique, not_null))
+        
+        return table_name, tuple(column_specs)
+    
+    def _execute_create_table(self, table_name: str, column_specs: tuple) -> str:
+        """Execute CREATE TABLE statement."""
+        columns = []
+        for col_name, type_name, max_len, primary_key, unique, not_null in column_specs:
+            # Data types are mutable, so each table gets fresh instances
+            if type_name == 'VARCHAR':
+                data_type = VarChar(max_len) if max_len is not None else VarChar()
+            else:
+                data_type = _TYPES[type_name]()
             
             if not_null or primary_key:
                 data_type.nullable = False
@@ -94,60 +227,76 @@ class SQLParser:
             columns.append(column)
         
         self.database.create_table(table_name, columns)
+        self._plan_cache.clear()
         return f"Table {table_name} created successfully"
     
-    def _execute_drop_table(self, sql: str) -> str:
-        """Execute DROP TABLE statement."""
-        match = re.match(r'DROP TABLE\s+(\w+)', sql, re.IGNORECASE)
+    @staticmethod
+    def _parse_drop_table(sql: str) -> tuple:
+        """Parse DROP TABLE into (table_name,)."""
+        match = _RE_DROP_TABLE.match(sql)
         if not match:
             raise ValueError("Invalid DROP TABLE syntax")
         
-        table_name = match.group(1)
+        return (match.group(1),)
+    
+    def _execute_drop_table(self, table_name: str) -> str:
+        """Execute DROP TABLE statement."""
         self.database.drop_table(table_name)
+        self._plan_cache.clear()
         return f"Table {table_name} dropped successfully"
     
-    def _execute_insert(self, sql: str) -> str:
-        """Execute INSERT INTO statement."""
-        # Pattern: INSERT INTO table (col1, col2) VALUES (val1, val2)
-        match = re.match(
-            r'INSERT INTO\s+(\w+)\s*\((.*?)\)\s*VALUES\s*\((.*?)\)',
-            sql,
-            re.IGNORECASE | re.DOTALL
-        )
+    @staticmethod
+    def _parse_insert(sql: str) -> tuple:
+        """Parse INSERT INTO into (table_name, columns, rows of values)."""
+        # Pattern: INSERT INTO table (col1, col2) VALUES (val1, val2)[, (val1, val2) ...]
+        match = _RE_INSERT.match(sql)
         if not match:
             raise ValueError("Invalid INSERT syntax")
         
         table_name = match.group(1)
         columns_str = match.group(2)
-        values_str = match.group(3)
-        
-        table = self.database.get_table(table_name)
+        rows_str = match.group(3)
         
-        columns = [col.strip() for col in columns_str.split(',')]
-        value_strs = self._parse_values(values_str)
+        columns = tuple(col.strip() for col in columns_str.split(','))
         
-        if len(columns) != len(value_strs):
-            raise ValueError("Number of columns and values do not match")
+        rows = []
+        pos = 0
+        while pos < len(rows_str):
+            row_match = _RE_INSERT_ROW.match(rows_str, pos)
+            if not row_match:
+                raise ValueError("Invalid INSERT syntax")
+            pos = row_match.end()
+            
+            value_strs = SQLParser._parse_values(row_match.group(1))
+            if len(columns) != len(value_strs):
+                raise ValueError("Number of columns and values do not match")
+            rows.append(tuple(SQLParser._parse_value(val_str) for val_str in value_strs))
         
-        values = {}
-        for col_name, val_str in zip(columns, value_strs):
-            values[col_name] = self._parse_value(val_str, table.columns[col_name].data_type)
+        if not rows:
+            raise ValueError("Invalid INSERT syntax")
         
-        row_id = table.insert(values)
-        return f"1 row inserted (ID: {row_id})"
+        return table_name, columns, tuple(rows)
     
-    def _execute_select(self, sql: str) -> List[Dict[str, Any]]:
-        """Execute SELECT statement."""
-        # Handle JOIN queries
-        if 'JOIN' in sql.upper():
-            return self._execute_select_join(sql)
+    def _prepare_insert(self, table_name: str, columns: tuple, rows: tuple) -> PreparedPlan:
+        """Prepare INSERT INTO statement."""
+        table = self.database.get_table(table_name)
+        return PreparedPlan('insert', table, columns=columns, values=rows)
+    
+    def _execute_insert(self, plan: PreparedPlan) -> str:
+        """Execute INSERT INTO statement."""
+        columns = plan.columns
+        if len(plan.values) == 1:
+            row_id = plan.table.insert(dict(zip(columns, plan.values[0])))
+            return f"1 row inserted (ID: {row_id})"
         
+        row_ids = plan.table.insert_many([dict(zip(columns, values)) for values in plan.values])
+        return f"{len(row_ids)} rows inserted"
+    
+    @staticmethod
+    def _parse_select(sql: str) -> tuple:
+        """Parse SELECT into (columns, table_name, where)."""
         # Pattern: SELECT columns FROM table [WHERE condition]
-        match = re.match(
-            r'SELECT\s+(.*?)\s+FROM\s+(\w+)(?:\s+WHERE\s+(.*))?',
-            sql,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = _RE_SELECT.match(sql)
         if not match:
             raise ValueError("Invalid SELECT syntax")
         
@@ -155,29 +304,35 @@ class SQLParser:
         table_name = match.group(2)
         where_str = match.group(3)
         
-        table = self.database.get_table(table_name)
-        
         # Parse columns
         if columns_str == '*':
             columns = None
         else:
-            columns = [col.strip() for col in columns_str.split(',')]
+            columns = tuple(col.strip() for col in columns_str.split(','))
         
         # Parse WHERE clause
-        where_func = None
-        if where_str:
-            where_func = self._parse_where(where_str, table)
+        where = SQLParser._parse_where(where_str) if where_str else None
         
-        return table.select(columns=columns, where=where_func)
+        return columns, table_name, where
     
-    def _execute_select_join(self, sql: str) -> List[Dict[str, Any]]:
-        """Execute SELECT with JOIN."""
-        # Pattern: SELECT columns FROM table1 [LEFT] JOIN table2 ON table1.col = table2.col
-        match = re.match(
-            r'SELECT\s+(.*?)\s+FROM\s+(\w+)\s+(LEFT\s+)?JOIN\s+(\w+)\s+ON\s+(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)',
-            sql,
-            re.IGNORECASE
+    def _prepare_select(self, columns: Optional[tuple], table_name: str,
+                        where: Optional[tuple]) -> PreparedPlan:
+        """Prepare SELECT statement."""
+        table = self.database.get_table(table_name)
+        return PreparedPlan('select', table, columns=columns, where=self._bind_where(where, table))
+    
+    def _execute_select(self, plan: PreparedPlan) -> List[Dict[str, Any]]:
+        """Execute SELECT statement."""
+        return plan.table.select(
+            columns=list(plan.columns) if plan.columns is not None else None,
+            where=plan.where
         )
+    
+    @staticmethod
+    def _parse_select_join(sql: str) -> tuple:
+        """Parse SELECT with JOIN into its join arguments."""
+        # Pattern: SELECT columns FROM table1 [LEFT] JOIN table2 ON table1.col = table2.col
+        match = _RE_SELECT_JOIN.match(sql)
         if not match:
             raise ValueError("Invalid SELECT JOIN syntax")
         
@@ -198,25 +353,28 @@ class SQLParser:
         if columns_str == '*':
             select_columns = None
         else:
-            select_columns = [col.strip() for col in columns_str.split(',')]
+            select_columns = tuple(col.strip() for col in columns_str.split(','))
         
         join_type = "left" if is_left_join else "inner"
         
+        return left_table, right_table, join_left_col, join_right_col, join_type, select_columns
+    
+    def _execute_select_join(self, left_table: str, right_table: str,
+                             join_left_col: str, join_right_col: str,
+                             join_type: str, select_columns: Optional[tuple]) -> List[Dict[str, Any]]:
+        """Execute SELECT with JOIN."""
         return self.database.join(
             left_table, right_table,
             join_left_col, join_right_col,
             join_type=join_type,
-            select_columns=select_columns
+            select_columns=list(select_columns) if select_columns is not None else None
         )
     
-    def _execute_update(self, sql: str) -> str:
-        """Execute UPDATE statement."""
+    @staticmethod
+    def _parse_update(sql: str) -> tuple:
+        """Parse UPDATE into (table_name, assignments, where)."""
         # Pattern: UPDATE table SET col1=val1, col2=val2 [WHERE condition]
-        match = re.match(
-            r'UPDATE\s+(\w+)\s+SET\s+(.*?)(?:\s+WHERE\s+(.*))?$',
-            sql,
-            re.IGNORECASE | re.DOTALL
-        )
+        match = _RE_UPDATE.match(sql)
         if not match:
             raise ValueError("Invalid UPDATE syntax")
         
@@ -224,60 +382,64 @@ class SQLParser:
         set_str = match.group(2)
         where_str = match.group(3)
         
-        table = self.database.get_table(table_name)
-        
-        # Parse SET clause
-        updates = {}
-        for assignment in set_str.split(','):
-            assignment = assignment.strip()
-            match = re.match(r'(\w+)\s*=\s*(.+)', assignment)
-            if not match:
+        # Parse SET clause; commas inside quoted values do not split it
+        assignments = []
+        for assignment in SQLParser._parse_values(set_str):
+            col_name, sep, val_str = assignment.partition('=')
+            col_name = col_name.strip()
+            val_str = val_str.strip()
+            if not sep or not col_name.isidentifier() or not val_str:
                 raise ValueError(f"Invalid assignment: {assignment}")
             
-            col_name = match.group(1)
-            val_str = match.group(2).strip()
-            updates[col_name] = self._parse_value(val_str, table.columns[col_name].data_type)
+            assignments.append((col_name, SQLParser._parse_value(val_str)))
         
         # Parse WHERE clause
-        where_func = None
-        if where_str:
-            where_func = self._parse_where(where_str, table)
+        where = SQLParser._parse_where(where_str) if where_str else None
         
-        count = table.update(updates, where=where_func)
+        return table_name, tuple(assignments), where
+    
+    def _prepare_update(self, table_name: str, assignments: tuple,
+                        where: Optional[tuple]) -> PreparedPlan:
+        """Prepare UPDATE statement."""
+        table = self.database.get_table(table_name)
+        return PreparedPlan('update', table, updates=assignments, where=self._bind_where(where, table))
+    
+    def _execute_update(self, plan: PreparedPlan) -> str:
+        """Execute UPDATE statement."""
+        count = plan.table.update(dict(plan.updates), where=plan.where)
         return f"{count} row(s) updated"
     
-    def _execute_delete(self, sql: str) -> str:
-        """Execute DELETE FROM statement."""
+    @staticmethod
+    def _parse_delete(sql: str) -> tuple:
+        """Parse DELETE FROM into (table_name, where)."""
         # Pattern: DELETE FROM table [WHERE condition]
-        match = re.match(
-            r'DELETE FROM\s+(\w+)(?:\s+WHERE\s+(.*))?',
-            sql,
-            re.IGNORECASE
-        )
+        match = _RE_DELETE.match(sql)
         if not match:
             raise ValueError("Invalid DELETE syntax")
         
         table_name = match.group(1)
         where_str = match.group(2)
         
-        table = self.database.get_table(table_name)
-        
         # Parse WHERE clause
-        where_func = None
-        if where_str:
-            where_func = self._parse_where(where_str, table)
+        where = SQLParser._parse_where(where_str) if where_str else None
         
-        count = table.delete(where=where_func)
+        return table_name, where
+    
+    def _prepare_delete(self, table_name: str, where: Optional[tuple]) -> PreparedPlan:
+        """Prepare DELETE FROM statement."""
+        table = self.database.get_table(table_name)
+        return PreparedPlan('delete', table, where=self._bind_where(where, table))
+    
+    def _execute_delete(self, plan: PreparedPlan) -> str:
+        """Execute DELETE FROM statement."""
+        count = plan.table.delete(where=plan.where)
         return f"{count} row(s) deleted"
     
-    def _execute_create_index(self, sql: str) -> str:
-        """Execute CREATE INDEX statement."""
+    @staticmethod
+    def _parse_create_index(sql: str) -> tuple:
+        """Parse CREATE INDEX into (is_unique, table_name, column_name)."""
         # Pattern: CREATE INDEX index_name ON table (column)
-        match = re.match(
-            r'CREATE\s+(UNIQUE\s+)?INDEX\s+\w+\s+ON\s+(\w+)\s*\((\w+)\)',
-            sql,
-            re.IGNORECASE
-        )
+        match = _RE_CREATE_INDEX.match(sql)
         if not match:
             raise ValueError("Invalid CREATE INDEX syntax")
         
@@ -285,54 +447,55 @@ class SQLParser:
         table_name = match.group(2)
         column_name = match.group(3)
         
+        return is_unique, table_name, column_name
+    
+    def _execute_create_index(self, is_unique: bool, table_name: str, column_name: str) -> str:
+        """Execute CREATE INDEX statement."""
         table = self.database.get_table(table_name)
         table.create_index(column_name, unique=is_unique)
         
         return f"Index created on {table_name}.{column_name}"
     
-    def _parse_values(self, values_str: str) -> List[str]:
+    @staticmethod
+    def _parse_values(values_str: str) -> List[str]:
         """Parse comma-separated values, handling quoted strings."""
+        if "'" not in values_str and '"' not in values_str:
+            # No quoted strings: every comma separates two values
+            parts = values_str.split(',')
+            if not parts[-1]:
+                parts.pop()
+            return [part.strip() for part in parts]
+        
+        # Quoted strings (which may contain commas) and the text between
+        # them are matched as whole tokens rather than char by char
         values = []
         current = []
-        in_quotes = False
-        quote_char = None
-        
-        for char in values_str:
-            if char in ('"', "'") and not in_quotes:
-                in_quotes = True
-                quote_char = char
-                current.append(char)
-            elif char == quote_char and in_quotes:
-                in_quotes = False
-                quote_char = None
-                current.append(char)
-            elif char == ',' and not in_quotes:
+        for token in _RE_VALUE_TOKEN.findall(values_str):
+            if token == ',':
                 values.append(''.join(current).strip())
                 current = []
             else:
-                current.append(char)
+                current.append(token)
         
         if current:
             values.append(''.join(current).strip())
         
         return values
     
-    def _parse_value(self, val_str: str, data_type):
+    @staticmethod
+    def _parse_value(val_str: str):
         """Parse a single value string."""
         val_str = val_str.strip()
         
-        # NULL
-        if val_str.upper() == 'NULL':
-            return None
-        
         # String (quoted)
         if (val_str.startswith('"') and val_str.endswith('"')) or \
            (val_str.startswith("'") and val_str.endswith("'")):
             return val_str[1:-1]
         
-        # Boolean
-        if val_str.upper() in ('TRUE', 'FALSE'):
-            return val_str.upper() == 'TRUE'
+        # NULL / Boolean
+        keyword = val_str.upper()
+        if keyword in _LITERALS:
+            return _LITERALS[keyword]
         
         # Try to parse as number or use as-is
         try:
@@ -343,12 +506,22 @@ class SQLParser:
         except ValueError:
             return val_str
     
-    def _parse_where(self, where_str: str, table):
-        """Parse WHERE clause and return a filter function."""
+    @staticmethod
+    def _parse_where(where_str: str) -> tuple:
+        """Parse WHERE clause into (column, operator, value).
+        
+        Conditions joined by AND or OR (AND binding tighter, no
+        parentheses) parse into ('AND' | 'OR', conditions) instead.
+        """
         where_str = where_str.strip()
         
+        for keyword in ('OR', 'AND'):
+            terms = SQLParser._split_where(where_str, keyword)
+            if len(terms) > 1:
+                return keyword, tuple(SQLParser._parse_where(term) for term in terms)
+        
         # Simple condition: column operator value
-        match = re.match(r'(\w+)\s*(=|!=|<>|<|>|<=|>=)\s*(.+)', where_str)
+        match = _RE_WHERE_COND.match(where_str)
         if not match:
             raise ValueError(f"Unsupported WHERE clause: {where_str}")
         
@@ -356,25 +529,49 @@ class SQLParser:
         operator = match.group(2)
         val_str = match.group(3).strip()
         
+        return col_name, operator, SQLParser._parse_value(val_str)
+    
+    @staticmethod
+    def _split_where(where_str: str, keyword: str) -> List[str]:
+        """Split a WHERE clause on a keyword that is not inside a quoted string."""
+        terms = []
+        start = 0
+        for match in _RE_WHERE_SPLIT.finditer(where_str):
+            if match.group(1) and match.group(1).upper() == keyword:
+                terms.append(where_str[start:match.start()])
+                start = match.end()
+        terms.append(where_str[start:])
+        return terms
+    
+    def _bind_where(self, where: Optional[tuple], table) -> Optional[Any]:
+        """Check a parsed WHERE clause against the table and return a predicate."""
+        if where is None:
+            return None
+        
+        if len(where) == 2:
+            kind, terms = where
+            return CompoundPredicate(kind, [self._bind_where(term, table) for term in terms])
+        
+        col_name, operator, value = where
         if col_name not in table.columns:
             raise ValueError(f"Column {col_name} does not exist")
         
-        value = self._parse_value(val_str, table.columns[col_name].data_type)
-        
-        def where_func(row):
-            row_val = row[col_name]
-            if operator == '=':
-                return row_val == value
-            elif operator in ('!=', '<>'):
-                return row_val != value
-            elif operator == '<':
-                return row_val < value
-            elif operator == '>':
-                return row_val > value
-            elif operator == '<=':
-                return row_val <= value
-            elif operator == '>=':
-                return row_val >= value
-            return False
-        
-        return where_func
+        return Predicate(col_name, operator, value)
+    
+    # Statement handlers by kind
+    _PREPARERS = {
+        'insert': _prepare_insert,
+        'select': _prepare_select,
+        'update': _prepare_update,
+        'delete': _prepare_delete,
+    }
+    _EXECUTORS = {
+        'create_table': _execute_create_table,
+        'drop_table': _execute_drop_table,
+        'insert': _execute_insert,
+        'select': _execute_select,
+        'select_join': _execute_select_join,
+        'update': _execute_update,
+        'delete': _execute_delete,
+        'create_index': _execute_create_index,
+    }
@@ -1,9 +1,11 @@
 """
 Table structure and data storage.
 """
-from typing import List, Dict, Any, Optional
-from .data_types import DataType
+import sys
+from typing import List, Dict, Any, Optional, Sequence, Set, Tuple
+from .data_types import DataType, Integer
 from .index import Index
+from .predicate import Predicate, CompoundPredicate
 
 
 class Column:
@@ -20,6 +22,39 @@ class Column:
             self.unique = True
 
 
+class RowsView:
+    """Read-only, list-like view over a table's rows.
+    
+    Rows are stored column-wise; a row dict is only built when accessed.
+    """
+    
+    __slots__ = ('_table',)
+    
+    def __init__(self, table: 'Table'):
+        self._table = table
+    
+    def __len__(self) -> int:
+        return self._table.row_count
+    
+    def __getitem__(self, position: int) -> Dict[str, Any]:
+        table = self._table
+        if position < 0:
+            position += table.row_count
+        if not 0 <= position < table.row_count:
+            raise IndexError("row index out of range")
+        if not table.deleted:
+            return table.get_row(position)
+        return table.get_row(table._live_row_ids()[position])
+    
+    def __iter__(self):
+        table = self._table
+        order = table.column_order
+        deleted = table.deleted
+        for row_id, values in enumerate(zip(*(table.columns_data[col] for col in order))):
+            if row_id not in deleted:
+                yield dict(zip(order, values))
+
+
 class Table:
     """Represents a database table."""
     
@@ -27,8 +62,29 @@ class Table:
         self.name = name
         self.columns = {col.name: col for col in columns}
         self.column_order = [col.name for col in columns]
-        self.rows: List[Dict[str, Any]] = []
+        # "table.column" names used as join output keys, built once per table
+        self.qualified_names: Tuple[str, ...] = tuple(
+            sys.intern(f"{name}.{col.name}") for col in columns
+        )
+        # Column-oriented storage: one list per column, aligned by row ID.
+        # Row IDs are never shifted; deleted rows are tombstoned instead.
+        self.columns_data: Dict[str, List[Any]] = {col.name: [] for col in columns}
+        self.next_row_id = 0
+        self.row_count = 0
+        self.deleted: Set[int] = set()
+        # Bumped on every change to the stored rows, so callers can tell
+        # whether something they derived from the table is still current
+        self.version = 0
         self.indexes: Dict[str, Index] = {}
+        # (column, index) pairs of the unique indexes, the only ones the
+        # constraint checks on insert and update need to consult
+        self._unique_indexes: Tuple[Tuple[str, Index], ...] = ()
+        # Cast functions aligned with column_order, specialized per data type
+        self._casters = [col.data_type.make_caster() for col in columns]
+        # Columns an inserted row must provide
+        self._required_cols: Tuple[str, ...] = tuple(
+            col.name for col in columns if not col.data_type.nullable
+        )
         
         # Create indexes for primary key and unique columns
         for col in columns:
@@ -41,6 +97,100 @@ class Table:
             if col.primary_key:
                 self.primary_key = col.name
                 break
+        
+        # Highest INTEGER primary key ever stored, for next_pk(); None when
+        # the table has no integer primary key
+        self._max_pk: Optional[int] = None
+        if self.primary_key is not None and isinstance(self.columns[self.primary_key].data_type, Integer):
+            self._max_pk = 0
+    
+    @property
+    def rows(self) -> RowsView:
+        """All rows as dicts, materialized lazily from column storage."""
+        return RowsView(self)
+    
+    def __len__(self) -> int:
+        """Number of live rows, without building any of them."""
+        return self.row_count
+    
+    def get_row(self, row_id: int) -> Dict[str, Any]:
+        """Build the row dict for a row ID."""
+        return {col: self.columns_data[col][row_id] for col in self.column_order}
+    
+    def _live_row_ids(self) -> Sequence[int]:
+        """Return the IDs of all rows that have not been deleted."""
+        if not self.deleted:
+            # Without tombstones every row ID is live; no list is needed
+            return range(self.next_row_id)
+        deleted = self.deleted
+        return [row_id for row_id in range(self.next_row_id) if row_id not in deleted]
+    
+    def _scan(self, where: Optional[callable] = None) -> Sequence[int]:
+        """Return the IDs of rows matching a filter function."""
+        if where is None:
+            return self._live_row_ids()
+        
+        deleted = self.deleted
+        if isinstance(where, Predicate):
+            if where.operator == '=' and where.column in self.indexes:
+                # Point lookup: the index only holds live rows
+                return sorted(self.indexes[where.column].lookup(where.value))
+            # Only the filtered column needs to be read
+            row_ids = where.scan(self.columns_data[where.column])
+            if deleted:
+                row_ids = [row_id for row_id in row_ids if row_id not in deleted]
+            return row_ids
+        if isinstance(where, CompoundPredicate):
+            if where.kind == 'AND':
+                return self._scan_all(where.children)
+            # OR: union of the rows matched by each branch, each of which
+            # may be answered from an index
+            matched = set()
+            for child in where.children:
+                matched.update(self._scan(child))
+            return sorted(matched)
+        
+        order = self.column_order
+        columns_data = [self.columns_data[col] for col in order]
+        return [
+            row_id
+            for row_id, values in enumerate(zip(*columns_data))
+            if row_id not in deleted and where(dict(zip(order, values)))
+        ]
+    
+    def _scan_all(self, conditions: List[Any]) -> Sequence[int]:
+        """Return the IDs of rows matching every condition (AND).
+        
+        Equality predicates on indexed columns are answered by intersecting
+        their posting sets, smallest first; the remaining conditions only
+        filter the surviving candidates.
+        """
+        indexed = [
+            cond for cond in conditions
+            if isinstance(cond, Predicate) and cond.operator == '=' and cond.column in self.indexes
+        ]
+        if indexed:
+            postings = sorted(
+                (self.indexes[cond.column].lookup(cond.value) for cond in indexed),
+                key=len
+            )
+            row_ids = sorted(postings[0].intersection(*postings[1:]))
+            rest = [cond for cond in conditions if cond not in indexed]
+        else:
+            row_ids = self._scan(conditions[0])
+            rest = conditions[1:]
+        
+        for cond in rest:
+            if not row_ids:
+                break
+            if isinstance(cond, Predicate):
+                test = cond.test
+                values = self.columns_data[cond.column]
+                row_ids = [row_id for row_id in row_ids if test(values[row_id])]
+            else:
+                row_ids = [row_id for row_id in row_ids if cond(self.get_row(row_id))]
+        
+        return row_ids
     
     def create_index(self, column_name: str, unique=False):
         """Create an index on a column."""
@@ -49,130 +199,339 @@ class Table:
         
         index = Index(column_name, unique)
         # Build index from existing rows
-        for row_id, row in enumerate(self.rows):
-            index.add(row[column_name], row_id)
+        index.rebuild(self.columns_data[column_name], self.deleted)
         
         self.indexes[column_name] = index
+        self._unique_indexes = tuple(
+            (col_name, index) for col_name, index in self.indexes.items() if index.unique
+        )
     
     def insert(self, values: Dict[str, Any]) -> int:
         """Insert a row into the table."""
         # Validate all required columns are present
-        for col_name in self.column_order:
+        for col_name in self._required_cols:
             if col_name not in values:
-                if not self.columns[col_name].data_type.nullable:
-                    raise ValueError(f"Column {col_name} is required")
-                values[col_name] = None
+                raise ValueError(f"Column {col_name} is required")
         
-        # Cast and validate values
-        row = {}
-        for col_name, value in values.items():
+        for col_name in values:
             if col_name not in self.columns:
                 raise ValueError(f"Column {col_name} does not exist")
-            
-            col = self.columns[col_name]
-            # Cast first, then validate the casted value
+        
+        # Cast values with the per-column specialized casters; omitted
+        # columns are NULL
+        row = {}
+        for col_name, cast in zip(self.column_order, self._casters):
+            value = values.get(col_name)
             try:
-                casted_value = col.data_type.cast(value)
-                row[col_name] = casted_value
+                row[col_name] = cast(value)
             except (ValueError, TypeError) as e:
                 raise ValueError(f"Invalid value for column {col_name}: {value} - {str(e)}")
         
         # Check unique constraints via indexes
-        for col_name, index in self.indexes.items():
-            if index.unique and row[col_name] is not None:
-                if index.lookup(row[col_name]):
-                    raise ValueError(f"Duplicate value for unique column {col_name}: {row[col_name]}")
+        for col_name, index in self._unique_indexes:
+            value = row[col_name]
+            if value is not None and value in index:
+                raise ValueError(f"Duplicate value for unique column {col_name}: {value}")
         
         # Insert row
-        row_id = len(self.rows)
-        self.rows.append(row)
+        row_id = self.next_row_id
+        for col_name in self.column_order:
+            self.columns_data[col_name].append(row[col_name])
+        self.next_row_id += 1
+        self.row_count += 1
+        self.version += 1
         
         # Update indexes
         for col_name, index in self.indexes.items():
             index.add(row[col_name], row_id)
         
+        if self._max_pk is not None:
+            self._note_pks((row[self.primary_key],))
         return row_id
     
+    def insert_many(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert several rows, with the same checks as insert().
+        
+        Every row is validated and cast before any is stored, so either all
+        rows are inserted or, if one is invalid, none are. Returns the new
+        row IDs.
+        """
+        if not rows:
+            return []
+        
+        columns = self.columns
+        for values in rows:
+            for col_name in values:
+                if col_name not in columns:
+                    raise ValueError(f"Column {col_name} does not exist")
+        
+        # Cast column by column; missing values are NULL where allowed
+        casted = {}
+        for col_name, cast in zip(self.column_order, self._casters):
+            required = not columns[col_name].data_type.nullable
+            column = []
+            for values in rows:
+                if col_name not in values and required:
+                    raise ValueError(f"Column {col_name} is required")
+                value = values.get(col_name)
+                try:
+                    column.append(cast(value))
+                except (ValueError, TypeError) as e:
+                    raise ValueError(f"Invalid value for column {col_name}: {value} - {str(e)}")
+            casted[col_name] = column
+        
+        # Check unique constraints against stored rows and within the batch
+        for col_name, index in self._unique_indexes:
+            seen = set()
+            for value in casted[col_name]:
+                if value is None:
+                    continue
+                if value in seen or value in index:
+                    raise ValueError(f"Duplicate value for unique column {col_name}: {value}")
+                seen.add(value)
+        
+        # Insert rows
+        row_ids = range(self.next_row_id, self.next_row_id + len(rows))
+        for col_name, values in casted.items():
+            self.columns_data[col_name].extend(values)
+        self.next_row_id += len(rows)
+        self.row_count += len(rows)
+        self.version += 1
+        
+        # Update indexes
+        for col_name, index in self.indexes.items():
+            index.add_many(casted[col_name], row_ids)
+        
+        if self._max_pk is not None:
+            self._note_pks(casted[self.primary_key])
+        return list(row_ids)
+    
+    def bulk_insert(self, rows: List[Dict[str, Any]]) -> int:
+        """Append trusted rows, e.g. when loading a saved database.
+        
+        Values are cast column by column, but unique constraints are not
+        re-checked; indexes are rebuilt once at the end.
+        """
+        if not rows:
+            return 0
+        
+        # Cast every column before touching storage so a bad row leaves
+        # the table unchanged
+        casted = []
+        for col_name, cast in zip(self.column_order, self._casters):
+            try:
+                casted.append([cast(row.get(col_name)) for row in rows])
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid value for column {col_name}: {str(e)}")
+        
+        for col_name, values in zip(self.column_order, casted):
+            self.columns_data[col_name].extend(values)
+        
+        self.next_row_id += len(rows)
+        self.row_count += len(rows)
+        self.version += 1
+        
+        for col_name, index in self.indexes.items():
+            index.rebuild(self.columns_data[col_name], self.deleted)
+        
+        if self._max_pk is not None:
+            self._note_pks(self.columns_data[self.primary_key])
+        return len(rows)
+    
     def select(self, columns: Optional[List[str]] = None, where: Optional[callable] = None) -> List[Dict[str, Any]]:
         """Select rows from the table."""
         if columns is None:
+            # Every column, already known to exist
             columns = self.column_order
+        else:
+            # Validate columns
+            for col in columns:
+                if col not in self.columns:
+                    raise ValueError(f"Column {col} does not exist")
         
-        # Validate columns
+        # Filter rows; each projected column list is looked up once, not per row
+        projected = [(col, self.columns_data[col]) for col in columns]
+        return [
+            {col: values[row_id] for col, values in projected}
+            for row_id in self._scan(where)
+        ]
+    
+    def select_eq(self, column: str, value: Any, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Select rows whose column equals a value, via its index when it has one."""
+        if column not in self.columns:
+            raise ValueError(f"Column {column} does not exist")
+        return self.select(columns, where=Predicate(column, '=', value))
+    
+    def max_value(self, column: str) -> Any:
+        """Return the largest non-NULL value in a column, or None if there is none.
+        
+        An indexed column holds exactly its live values as index keys, so
+        those are used instead of the column's storage.
+        """
+        if column not in self.columns:
+            raise ValueError(f"Column {column} does not exist")
+        if column in self.indexes:
+            values = self.indexes[column].index
+        elif self.deleted:
+            values = [self.columns_data[column][row_id] for row_id in self._live_row_ids()]
+        else:
+            values = self.columns_data[column]
+        return max((value for value in values if value is not None), default=None)
+    
+    def select_columns(self, columns: List[str], where: Optional[callable] = None) -> List[Tuple[Any, ...]]:
+        """Select rows as tuples of the given columns' values, without building dicts."""
         for col in columns:
             if col not in self.columns:
                 raise ValueError(f"Column {col} does not exist")
         
-        # Filter rows
-        result = []
-        for row in self.rows:
-            if where is None or where(row):
-                result.append({col: row[col] for col in columns})
+        projected = [self.columns_data[col] for col in columns]
+        if where is None and not self.deleted:
+            return list(zip(*projected))
         
-        return result
+        row_ids = self._scan(where)
+        return list(zip(*([values[row_id] for row_id in row_ids] for values in projected)))
     
     def update(self, values: Dict[str, Any], where: Optional[callable] = None) -> int:
         """Update rows in the table."""
-        # Validate and cast new values
+        # Cast new values the same way insert() does
+        casters = dict(zip(self.column_order, self._casters))
         updates = {}
         for col_name, value in values.items():
             if col_name not in self.columns:
                 raise ValueError(f"Column {col_name} does not exist")
             
-            col = self.columns[col_name]
-            if not col.data_type.validate(value):
-                raise ValueError(f"Invalid value for column {col_name}: {value}")
-            
-            updates[col_name] = col.data_type.cast(value)
+            try:
+                updates[col_name] = casters[col_name](value)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"Invalid value for column {col_name}: {value} - {str(e)}")
+        
+        # Resolve the touched columns and their indexes once, not per row
+        targets = [(self.columns_data[col_name], new_val) for col_name, new_val in updates.items()]
+        indexed = [
+            (col_name, new_val, self.indexes[col_name], self.columns_data[col_name])
+            for col_name, new_val in updates.items()
+            if col_name in self.indexes
+        ]
         
-        # Update matching rows
+        # Update matching rows. A uniqueness failure stops the update, but
+        # rows already updated stay updated: the version and the highest
+        # primary key must still account for them.
         count = 0
-        for row_id, row in enumerate(self.rows):
-            if where is None or where(row):
-                # Check unique constraints for updated values
-                for col_name in updates:
-                    if col_name in self.indexes and self.indexes[col_name].unique:
-                        # Remove old value from index temporarily
-                        old_val = row[col_name]
-                        self.indexes[col_name].remove(old_val, row_id)
-                        
-                        # Check if new value violates uniqueness
-                        if updates[col_name] is not None:
-                            existing = self.indexes[col_name].lookup(updates[col_name])
-                            if existing:
-                                # Restore old value and raise error
-                                self.indexes[col_name].add(old_val, row_id)
-                                raise ValueError(f"Duplicate value for unique column {col_name}: {updates[col_name]}")
-                        
-                        # Re-add with new value
-                        self.indexes[col_name].add(updates[col_name], row_id)
+        try:
+            for row_id in self._scan(where):
+                for position, (col_name, new_val, index, column) in enumerate(indexed):
+                    # Remove old value from index temporarily
+                    old_val = column[row_id]
+                    index.remove(old_val, row_id)
+                    
+                    # Check if new value violates uniqueness
+                    if index.unique and new_val is not None and new_val in index:
+                        # Restore this row's index entries and raise error
+                        index.add(old_val, row_id)
+                        for _, done_val, done_index, done_column in indexed[:position]:
+                            done_index.remove(done_val, row_id)
+                            done_index.add(done_column[row_id], row_id)
+                        raise ValueError(f"Duplicate value for unique column {col_name}: {new_val}")
+                    
+                    # Re-add with new value
+                    index.add(new_val, row_id)
                 
                 # Apply updates
-                row.update(updates)
+                for column, new_val in targets:
+                    column[row_id] = new_val
                 count += 1
-        
+        finally:
+            if count:
+                self.version += 1
+                if self._max_pk is not None and self.primary_key in updates:
+                    self._note_pks((updates[self.primary_key],))
         return count
     
     def delete(self, where: Optional[callable] = None) -> int:
         """Delete rows from the table."""
-        to_delete = []
-        for row_id, row in enumerate(self.rows):
-            if where is None or where(row):
-                to_delete.append(row_id)
-        
-        # Delete in reverse order to maintain indices
-        for row_id in reversed(to_delete):
-            row = self.rows[row_id]
-            
-            # Remove from indexes
-            for col_name, index in self.indexes.items():
-                index.remove(row[col_name], row_id)
-            
-            # Remove row
-            del self.rows[row_id]
-            
-            # Update indexes for shifted rows
-            for col_name, index in self.indexes.items():
-                index.shift_after(row_id)
+        to_delete = self._scan(where)
+        
+        # Tombstone the rows; other row IDs stay valid
+        self.deleted.update(to_delete)
+        self.row_count -= len(to_delete)
+        if to_delete:
+            self.version += 1
         
+        if len(self.deleted) > self.row_count:
+            # Reclaim tombstoned slots once they outnumber the live rows;
+            # compaction rebuilds the indexes anyway
+            self._compact()
+        else:
+            # Remove from indexes, one index (and one column) at a time
+            for col_name, index in self.indexes.items():
+                values = self.columns_data[col_name]
+                for row_id in to_delete:
+                    index.remove(values[row_id], row_id)
         return len(to_delete)
+    
+    @property
+    def max_pk(self) -> Optional[int]:
+        """Highest INTEGER primary key ever stored, or None without one."""
+        return self._max_pk
+    
+    def note_max_pk(self, value: int) -> None:
+        """Raise max_pk to at least value, e.g. to restore it from a saved file."""
+        if self._max_pk is None:
+            raise ValueError(f"Table {self.name} has no INTEGER primary key")
+        self._note_pks((value,))
+    
+    def next_pk(self) -> int:
+        """Return the next free INTEGER primary key value.
+        
+        Keys are not reused: this is one more than the highest key ever
+        stored, even if that row has since been deleted.
+        """
+        if self._max_pk is None:
+            raise ValueError(f"Table {self.name} has no INTEGER primary key")
+        return self._max_pk + 1
+    
+    def _note_pks(self, values) -> None:
+        """Raise the highest primary key seen to cover newly stored keys."""
+        self._max_pk = max(self._max_pk, max((v for v in values if v is not None), default=0))
+    
+    def _pk_predicate(self, value: Any) -> Predicate:
+        """Build the equality predicate on the primary key, answered by its index."""
+        if self.primary_key is None:
+            raise ValueError(f"Table {self.name} has no primary key")
+        return Predicate(self.primary_key, '=', value)
+    
+    def has_pk(self, value: Any) -> bool:
+        """Check whether a row has this primary key value, from the index alone."""
+        if self.primary_key is None:
+            raise ValueError(f"Table {self.name} has no primary key")
+        return value in self.indexes[self.primary_key]
+    
+    def get_by_pk(self, value: Any) -> Optional[Dict[str, Any]]:
+        """Return the row with this primary key value, or None."""
+        if not self.has_pk(value):
+            return None
+        return self.select(where=self._pk_predicate(value))[0]
+    
+    def update_by_pk(self, value: Any, values: Dict[str, Any]) -> int:
+        """Update the row with this primary key value; returns 1, or 0 if there is none."""
+        return self.update(values, where=self._pk_predicate(value))
+    
+    def delete_by_pk(self, value: Any) -> int:
+        """Delete the row with this primary key value; returns 1, or 0 if there is none."""
+        if not self.has_pk(value):
+            return 0
+        return self.delete(where=self._pk_predicate(value))
+    
+    def _compact(self):
+        """Drop tombstoned rows from storage and renumber the live rows.
+        
+        Row IDs of live rows change, so every index is rebuilt.
+        """
+        live = self._live_row_ids()
+        for values in self.columns_data.values():
+            values[:] = [values[row_id] for row_id in live]
+        self.deleted.clear()
+        self.next_row_id = len(live)
+        
+        for col_name, index in self.indexes.items():
+            index.rebuild(self.columns_data[col_name])
@@ -64,6 +64,22 @@ class TestDataTypes(unittest.TestCase):
         # Test casting
         self.assertEqual(date_type.cast(today), today)
         self.assertEqual(date_type.cast("2026-01-16"), date(2026, 1, 16))
+        with self.assertRaises(ValueError):
+            date_type.cast("2026-13-01")
+    
+    def test_make_caster(self):
+        cast_int = Integer(nullable=False).make_caster()
+        self.assertEqual(cast_int(5), 5)
+        self.assertEqual(cast_int("7"), 7)
+        with self.assertRaises(ValueError):
+            cast_int(None)
+        
+        cast_str = VarChar(3).make_caster()
+        self.assertEqual(cast_str("abc"), "abc")
+        self.assertEqual(cast_str(12), "12")
+        self.assertIsNone(cast_str(None))
+        with self.assertRaises(ValueError):
+            cast_str("abcd")
     
     def test_nullable(self):
         nullable_int = Integer(nullable=True)
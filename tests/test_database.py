@@ -2,12 +2,15 @@
 Tests for database operations including JOIN and persistence.
 """
 import unittest
+import math
 import os
 import tempfile
+from unittest import mock
 from datetime import date
+from rdbms import database
 from rdbms.database import Database
 from rdbms.table import Column
-from rdbms.data_types import Integer, VarChar, Date
+from rdbms.data_types import Integer, VarChar, Date, Float
 
 
 class TestDatabase(unittest.TestCase):
@@ -48,6 +51,13 @@ class TestDatabase(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['users.name'], 'Alice')
         self.assertEqual(result[0]['posts.title'], 'Post 1')
+        
+        # Projected join
+        result = db.join('posts', 'users', 'user_id', 'id',
+                         select_columns=['posts.title', 'users.name', 'users.missing'])
+        self.assertEqual(result[1], {'posts.title': 'Post 2', 'users.name': 'Alice', 'users.missing': None})
+        result = db.join('posts', 'users', 'user_id', 'id', select_columns=['users.name'])
+        self.assertEqual(result, [{'users.name': 'Alice'}, {'users.name': 'Alice'}])
     
     def test_join_left(self):
         db = Database('test')
@@ -79,6 +89,60 @@ class TestDatabase(unittest.TestCase):
         # Second row should have NULL for user columns
         orphaned = [r for r in result if r['posts.id'] == 2][0]
         self.assertIsNone(orphaned['users.name'])
+        
+        # The streaming variant yields the same rows lazily
+        rows = db.iter_join('posts', 'users', 'user_id', 'id', join_type='left')
+        self.assertEqual(next(rows), result[0])
+        self.assertEqual(list(rows), result[1:])
+        
+        # Rows are read from the tables as they are reached, so changes made
+        # mid-iteration show up in the rows not yet yielded
+        posts.insert({'id': 3, 'user_id': 1, 'title': 'Post 3'})
+        rows = db.iter_join('posts', 'users', 'user_id', 'id', join_type='left')
+        next(rows)
+        posts.update_by_pk(3, {'title': 'Edited'})
+        posts.delete_by_pk(2)
+        self.assertEqual([row['posts.title'] for row in rows], ['Edited'])
+    
+    def test_join_null_keys_do_not_match(self):
+        db = Database('test')
+        left = db.create_table('a', [Column('key', Integer())])
+        right = db.create_table('b', [Column('key', Integer())])
+        left.insert({'key': None})
+        right.insert({'key': None})
+        
+        self.assertEqual(db.join('a', 'b', 'key', 'key'), [])
+        result = db.join('a', 'b', 'key', 'key', join_type='left')
+        self.assertEqual(result, [{'a.key': None, 'b.key': None}])
+    
+    def test_merge_join_matches_hash_join(self):
+        db = Database('test')
+        users = db.create_table('users', [
+            Column('id', Integer(nullable=False), primary_key=True),
+            Column('name', VarChar(50))
+        ])
+        posts = db.create_table('posts', [
+            Column('id', Integer(nullable=False), primary_key=True),
+            Column('user_id', Integer())
+        ])
+        posts.create_index('user_id')
+        
+        users.insert({'id': 1, 'name': 'Alice'})
+        users.insert({'id': 2, 'name': 'Bob'})
+        posts.insert({'id': 1, 'user_id': 2})
+        posts.insert({'id': 2, 'user_id': 1})
+        posts.insert({'id': 3, 'user_id': 99})
+        posts.insert({'id': 4, 'user_id': None})
+        posts.insert({'id': 5, 'user_id': 2})
+        
+        def sort_key(row):
+            return (row['posts.id'], row['users.id'] or 0)
+        
+        for join_type in ('inner', 'left'):
+            hash_result = db.join('posts', 'users', 'user_id', 'id', join_type=join_type)
+            with mock.patch('rdbms.database.MERGE_JOIN_MIN_ROWS', 1):
+                merge_result = db.join('posts', 'users', 'user_id', 'id', join_type=join_type)
+            self.assertEqual(sorted(hash_result, key=sort_key), sorted(merge_result, key=sort_key))
     
     def test_save_and_load(self):
         # Create a temporary file
@@ -95,9 +159,12 @@ class TestDatabase(unittest.TestCase):
             ])
             table.insert({'id': 1, 'name': 'Alice', 'created_at': date(2026, 1, 1)})
             table.insert({'id': 2, 'name': 'Bob', 'created_at': date(2026, 1, 2)})
+            table.insert({'id': 3, 'name': 'Carol', 'created_at': None})
+            db.create_table('tags', [Column('label', VarChar(20))])
             
-            # Save
-            db.save(temp_file)
+            # Save, with rows written across several chunks
+            with mock.patch('rdbms.database.SAVE_CHUNK_ROWS', 2):
+                db.save(temp_file)
             
             # Load
             db2 = Database.load(temp_file)
@@ -105,14 +172,148 @@ class TestDatabase(unittest.TestCase):
             self.assertIn('users', db2.tables)
             
             table2 = db2.get_table('users')
-            self.assertEqual(len(table2.rows), 2)
+            self.assertEqual(len(table2.rows), 3)
             self.assertEqual(table2.rows[0]['name'], 'Alice')
             self.assertEqual(table2.rows[0]['created_at'], date(2026, 1, 1))
+            self.assertEqual(table2.rows[2]['name'], 'Carol')
+            self.assertEqual(len(db2.get_table('tags').rows), 0)
         
         finally:
             # Clean up
             if os.path.exists(temp_file):
                 os.remove(temp_file)
+    
+    def test_save_and_load_without_orjson(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_file = f.name
+        
+        try:
+            db = Database('test')
+            table = db.create_table('events', [
+                Column('id', Integer(nullable=False), primary_key=True),
+                Column('day', Date())
+            ])
+            table.insert({'id': 1, 'day': date(2026, 1, 1)})
+            table.insert({'id': 2, 'day': None})
+            table.insert({'id': 3, 'day': date(2026, 1, 3)})
+            table.insert({'id': 4, 'day': None})
+            table.delete(where=lambda row: row['id'] in (2, 4))
+            
+            # The standard library fallback writes the same format
+            with mock.patch('rdbms.database.orjson', None):
+                db.save(temp_file)
+            
+            loaded = Database.load(temp_file).get_table('events')
+            self.assertEqual(loaded.next_pk(), 5)
+            rows = loaded.select()
+            self.assertEqual(rows, [
+                {'id': 1, 'day': date(2026, 1, 1)},
+                {'id': 3, 'day': date(2026, 1, 3)}
+            ])
+        
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def test_save_and_load_non_finite_floats(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_file = f.name
+        
+        try:
+            db = Database('test')
+            table = db.create_table('readings', [
+                Column('id', Integer(nullable=False), primary_key=True),
+                Column('value', Float(nullable=False))
+            ])
+            table.insert({'id': 1, 'value': float('inf')})
+            table.insert({'id': 2, 'value': float('-inf')})
+            table.insert({'id': 3, 'value': float('nan')})
+            table.insert({'id': 4, 'value': 1.5})
+            
+            # Both serializers keep them as Infinity and NaN, not NULL
+            for backend in (database.orjson, None):
+                with mock.patch('rdbms.database.orjson', backend):
+                    db.save(temp_file)
+                    loaded = Database.load(temp_file).get_table('readings')
+                values = [value for (value,) in loaded.select_columns(['value'])]
+                self.assertEqual(values[:2], [float('inf'), float('-inf')])
+                self.assertTrue(math.isnan(values[2]))
+                self.assertEqual(values[3], 1.5)
+        
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def test_load_non_finite_floats(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            f.write('{"name": "test", "tables": {"readings": {'
+                    '"columns": [{"name": "value", "type": "FLOAT", "nullable": false}], '
+                    '"rows": [{"value": Infinity}, {"value": 2.5}]}}}')
+            temp_file = f.name
+        
+        try:
+            # Files saved by the json module may hold Infinity and NaN
+            table = Database.load(temp_file).get_table('readings')
+            self.assertEqual(table.select_columns(['value']), [(float('inf'),), (2.5,)])
+        
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def test_save_and_load_wide_integers(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_file = f.name
+        
+        try:
+            db = Database('test')
+            table = db.create_table('counters', [
+                Column('id', Integer(nullable=False), primary_key=True),
+                Column('total', Integer())
+            ])
+            table.insert({'id': 1, 'total': 2 ** 70})
+            table.insert({'id': 2, 'total': -2 ** 70})
+            table.insert({'id': 3, 'total': 5})
+            
+            for backend in (database.orjson, None):
+                with mock.patch('rdbms.database.orjson', backend):
+                    db.save(temp_file)
+                    loaded = Database.load(temp_file).get_table('counters')
+                self.assertEqual(loaded.select_columns(['total']), [(2 ** 70,), (-2 ** 70,), (5,)])
+        
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
+    def test_failed_save_keeps_previous_file(self):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
+            temp_file = f.name
+        
+        try:
+            db = Database('test')
+            users = db.create_table('users', [
+                Column('id', Integer(nullable=False), primary_key=True),
+                Column('name', VarChar(50))
+            ])
+            users.insert({'id': 1, 'name': 'Alice'})
+            db.save(temp_file)
+            
+            # The second table fails after the first has been written: no
+            # column type accepts the value, so it is stored directly
+            users.insert({'id': 2, 'name': 'Bob'})
+            readings = db.create_table('readings', [Column('value', Float())])
+            readings.insert({'value': 1.5})
+            readings.columns_data['value'][0] = object()
+            with self.assertRaises(TypeError):
+                db.save(temp_file)
+            
+            loaded = Database.load(temp_file)
+            self.assertEqual(loaded.list_tables(), ['users'])
+            self.assertEqual(len(loaded.get_table('users')), 1)
+            self.assertFalse(os.path.exists(temp_file + '.tmp'))
+        
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
 
 
 if __name__ == '__main__':
@@ -5,6 +5,8 @@ import unittest
 from datetime import date
 from rdbms.database import Database
 from rdbms.sql_parser import SQLParser
+from rdbms.table import Column
+from rdbms.data_types import Integer
 
 
 class TestSQLParser(unittest.TestCase):
@@ -33,6 +35,17 @@ class TestSQLParser(unittest.TestCase):
         table = self.db.get_table('users')
         self.assertEqual(len(table.rows), 1)
     
+    def test_insert_multiple_rows(self):
+        self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))")
+        result = self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Smith, (Al)'), (2, 'Bob')")
+        self.assertIn('2 rows inserted', result)
+        
+        rows = self.parser.execute("SELECT name FROM users")
+        self.assertEqual(rows, [{'name': 'Smith, (Al)'}, {'name': 'Bob'}])
+        
+        with self.assertRaises(ValueError):
+            self.parser.execute("INSERT INTO users (id, name) VALUES (3, 'Carol'), (4)")
+    
     def test_select(self):
         self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))")
         self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
@@ -50,6 +63,27 @@ class TestSQLParser(unittest.TestCase):
         rows = self.parser.execute("SELECT * FROM users WHERE id = 1")
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]['name'], 'Alice')
+        
+        # Two-character operators
+        self.assertEqual(len(self.parser.execute("SELECT * FROM users WHERE id <= 1")), 1)
+        self.assertEqual(len(self.parser.execute("SELECT * FROM users WHERE id >= 1")), 2)
+    
+    def test_select_and_or(self):
+        self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50), age INTEGER)")
+        self.parser.execute("INSERT INTO users (id, name, age) VALUES (1, 'Alice', 30), (2, 'Bob', 25), "
+                            "(3, 'Carol', 35), (4, 'Tom and Or', 40)")
+        
+        rows = self.parser.execute("SELECT id FROM users WHERE age > 26 AND name != 'Carol'")
+        self.assertEqual(rows, [{'id': 1}, {'id': 4}])
+        
+        rows = self.parser.execute("SELECT id FROM users WHERE id = 2 OR name = 'Carol' and age < 30")
+        self.assertEqual(rows, [{'id': 2}])
+        
+        rows = self.parser.execute("SELECT id FROM users WHERE id = 2 OR name = 'Tom and Or'")
+        self.assertEqual(rows, [{'id': 2}, {'id': 4}])
+        
+        result = self.parser.execute("DELETE FROM users WHERE id = 1 OR age >= 35")
+        self.assertIn('3 row(s) deleted', result)
     
     def test_update(self):
         self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))")
@@ -60,6 +94,13 @@ class TestSQLParser(unittest.TestCase):
         
         rows = self.parser.execute("SELECT * FROM users WHERE id = 1")
         self.assertEqual(rows[0]['name'], 'Alice Smith')
+        
+        self.parser.execute("UPDATE users SET name = 'Smith, Alice', id = 2 WHERE id = 1")
+        rows = self.parser.execute("SELECT * FROM users")
+        self.assertEqual(rows, [{'id': 2, 'name': 'Smith, Alice'}])
+        
+        with self.assertRaises(ValueError):
+            self.parser.execute("UPDATE users SET name WHERE id = 2")
     
     def test_delete(self):
         self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50))")
@@ -100,6 +141,44 @@ class TestSQLParser(unittest.TestCase):
         result = self.parser.execute("DROP TABLE temp")
         self.assertIn('dropped successfully', result)
         self.assertNotIn('temp', self.db.tables)
+    
+    def test_create_index(self):
+        self.parser.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(100))")
+        result = self.parser.execute("create unique index idx_email on users (email)")
+        self.assertIn('Index created', result)
+        self.assertTrue(self.db.get_table('users').indexes['email'].unique)
+        
+        with self.assertRaises(ValueError):
+            self.parser.execute("CREATE VIEW v AS SELECT * FROM users")
+    
+    def test_repeated_statements(self):
+        create = "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR(50) NOT NULL)"
+        self.parser.execute(create)
+        self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+        
+        # A cached INSERT is still checked against the current table state
+        with self.assertRaises(ValueError):
+            self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+        
+        # A cached CREATE TABLE builds fresh columns against the new schema
+        self.parser.execute("DROP TABLE users")
+        self.parser.execute(create)
+        self.assertEqual(len(self.parser.execute("SELECT * FROM users")), 0)
+        self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+        self.assertEqual(len(self.parser.execute("SELECT * FROM users WHERE id = 1")), 1)
+        
+        # Statements differing only in surrounding whitespace or a trailing
+        # semicolon share one cached plan
+        self.parser.execute("SELECT * FROM users")
+        cached = len(self.parser._plan_cache)
+        self.parser.execute("  SELECT * FROM users;\r\n")
+        self.assertEqual(len(self.parser._plan_cache), cached)
+        
+        # Cached plans are not reused once the table is replaced directly
+        self.db.drop_table('users')
+        self.db.create_table('users', [Column('id', Integer())])
+        with self.assertRaises(ValueError):
+            self.parser.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ Tests for the RDBMS table operations.
 import unittest
 from rdbms.table import Table, Column
 from rdbms.data_types import Integer, VarChar
+from rdbms.predicate import Predicate, CompoundPredicate
 
 
 class TestTable(unittest.TestCase):
@@ -24,6 +25,12 @@ class TestTable(unittest.TestCase):
         # Test required column
         with self.assertRaises(ValueError):
             self.table.insert({'id': 2, 'email': 'bob@test.com'})
+        
+        # Omitted nullable columns are stored as NULL
+        values = {'id': 2, 'name': 'Bob'}
+        self.table.insert(values)
+        self.assertIsNone(self.table.rows[1]['email'])
+        self.assertEqual(values, {'id': 2, 'name': 'Bob'})
     
     def test_unique_constraint(self):
         self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
@@ -36,6 +43,37 @@ class TestTable(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.table.insert({'id': 2, 'name': 'Bob', 'email': 'alice@test.com'})
     
+    def test_insert_many(self):
+        row_ids = self.table.insert_many([
+            {'id': 1, 'name': 'Alice', 'email': 'alice@test.com'},
+            {'id': 2, 'name': 'Bob'},
+        ])
+        self.assertEqual(row_ids, [0, 1])
+        self.assertIsNone(self.table.rows[1]['email'])
+        self.assertEqual(self.table.indexes['id'].lookup(2), {1})
+        
+        # Duplicates within the batch or against stored rows insert nothing
+        with self.assertRaises(ValueError):
+            self.table.insert_many([{'id': 3, 'name': 'Carol'}, {'id': 3, 'name': 'Dave'}])
+        with self.assertRaises(ValueError):
+            self.table.insert_many([{'id': 4, 'name': 'Erin'}, {'id': 1, 'name': 'Frank'}])
+        with self.assertRaises(ValueError):
+            self.table.insert_many([{'id': 5}])
+        self.assertEqual(len(self.table.rows), 2)
+    
+    def test_bulk_insert(self):
+        count = self.table.bulk_insert([
+            {'id': 1, 'name': 'Alice', 'email': 'alice@test.com'},
+            {'id': '2', 'name': 'Bob', 'email': None},
+        ])
+        self.assertEqual(count, 2)
+        self.assertEqual(self.table.columns_data['id'], [1, 2])
+        self.assertEqual(self.table.indexes['email'].lookup('alice@test.com'), {0})
+        
+        with self.assertRaises(ValueError):
+            self.table.bulk_insert([{'id': 3}])
+        self.assertEqual(len(self.table.columns_data['id']), 2)
+    
     def test_select(self):
         self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
         self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
@@ -55,6 +93,72 @@ class TestTable(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]['name'], 'Alice')
     
+    def test_select_columns(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob'})
+        self.table.insert({'id': 3, 'name': 'Carol'})
+        
+        self.assertEqual(self.table.select_columns(['id', 'name']), [(1, 'Alice'), (2, 'Bob'), (3, 'Carol')])
+        self.assertEqual(self.table.select_columns(['email'], where=Predicate('id', '<', 3)),
+                         [('alice@test.com',), (None,)])
+        
+        self.table.delete_by_pk(2)
+        self.assertEqual(dict(self.table.select_columns(['id', 'name'])), {1: 'Alice', 3: 'Carol'})
+        self.assertEqual(len(self.table), 2)
+    
+    def test_select_predicate(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
+        self.table.insert({'id': 3, 'name': 'Carol', 'email': 'carol@test.com'})
+        
+        rows = self.table.select(columns=['name'], where=Predicate('id', '>=', 2))
+        self.assertEqual(rows, [{'name': 'Bob'}, {'name': 'Carol'}])
+        
+        # Predicates also work as plain row filters
+        self.assertTrue(Predicate('name', '=', 'Alice')({'name': 'Alice'}))
+    
+    def test_select_numeric_predicate_skips_nulls(self):
+        table = Table('scores', [
+            Column('id', Integer(nullable=False), primary_key=True),
+            Column('score', Integer())
+        ])
+        table.insert({'id': 1, 'score': 90})
+        table.insert({'id': 2, 'score': None})
+        table.insert({'id': 3, 'score': 70})
+        
+        rows = table.select(columns=['id'], where=Predicate('score', '>', 80))
+        self.assertEqual(rows, [{'id': 1}])
+    
+    def test_delete_string_predicate_skips_nulls(self):
+        table = Table('users', [
+            Column('id', Integer(nullable=False), primary_key=True),
+            Column('name', VarChar(50))
+        ])
+        table.insert({'id': 1, 'name': 'Alice'})
+        table.insert({'id': 2, 'name': None})
+        table.insert({'id': 3, 'name': 'Bob'})
+        
+        self.assertEqual(table.delete(where=Predicate('name', '<', 'B')), 1)
+        self.assertEqual([row['id'] for row in table.rows], [2, 3])
+    
+    def test_select_compound_and(self):
+        self.table.create_index('name')
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
+        self.table.insert({'id': 3, 'name': 'Bob', 'email': 'bob2@test.com'})
+        
+        where = CompoundPredicate('AND', [
+            Predicate('name', '=', 'Bob'),
+            Predicate('email', '=', 'bob2@test.com'),
+        ])
+        self.assertEqual(self.table.select(columns=['id'], where=where), [{'id': 3}])
+        
+        where = CompoundPredicate('AND', [
+            Predicate('name', '=', 'Bob'),
+            Predicate('id', '<', 3),
+        ])
+        self.assertEqual(self.table.select(columns=['id'], where=where), [{'id': 2}])
+    
     def test_update(self):
         self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
         self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
@@ -69,6 +173,34 @@ class TestTable(unittest.TestCase):
         # Update with unique constraint violation
         with self.assertRaises(ValueError):
             self.table.update({'email': 'bob@test.com'}, where=lambda row: row['id'] == 1)
+        
+        # Values are cast like on insert; invalid ones are rejected
+        self.table.update({'id': '3'}, where=lambda row: row['id'] == 1)
+        self.assertEqual(self.table.select(columns=['id'], where=Predicate('id', '=', 3)), [{'id': 3}])
+        with self.assertRaises(ValueError):
+            self.table.update({'name': None})
+        with self.assertRaises(ValueError):
+            self.table.update({'id': 'three'})
+    
+    def test_update_failing_partway(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
+        
+        # The first row becomes id 3 before the second one collides with it
+        version = self.table.version
+        with self.assertRaises(ValueError):
+            self.table.update({'id': 3})
+        self.assertGreater(self.table.version, version)
+        self.assertEqual(self.table.select_columns(['id']), [(3,), (2,)])
+        self.assertEqual(self.table.next_pk(), 4)
+        self.table.insert({'id': self.table.next_pk(), 'name': 'Carol'})
+        
+        # A row rejected on a later column keeps its earlier index entries
+        with self.assertRaises(ValueError):
+            self.table.update({'id': 10, 'email': 'bob@test.com'}, where=Predicate('id', '=', 3))
+        self.assertTrue(self.table.has_pk(3))
+        self.assertFalse(self.table.has_pk(10))
+        self.assertEqual(self.table.get_by_pk(3)['email'], 'alice@test.com')
     
     def test_delete(self):
         self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
@@ -81,6 +213,119 @@ class TestTable(unittest.TestCase):
         rows = self.table.select()
         self.assertEqual(rows[0]['name'], 'Bob')
     
+    def test_select_eq(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob'})
+        self.table.insert({'id': 3, 'name': 'Alice'})
+        
+        # Indexed and unindexed columns give the same answers
+        self.assertEqual(self.table.select_eq('email', 'alice@test.com', columns=['id']), [{'id': 1}])
+        self.assertEqual(self.table.select_eq('name', 'Alice', columns=['id']), [{'id': 1}, {'id': 3}])
+        self.assertEqual(self.table.select_eq('id', 4), [])
+        with self.assertRaises(ValueError):
+            self.table.select_eq('missing', 1)
+    
+    def test_primary_key_access(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob', 'email': 'bob@test.com'})
+        
+        self.assertEqual(self.table.get_by_pk(2)['name'], 'Bob')
+        self.assertIsNone(self.table.get_by_pk(3))
+        self.assertTrue(self.table.has_pk(2))
+        self.assertFalse(self.table.has_pk(3))
+        
+        self.assertEqual(self.table.update_by_pk(1, {'name': 'Alice Smith'}), 1)
+        self.assertEqual(self.table.get_by_pk(1)['name'], 'Alice Smith')
+        self.assertEqual(self.table.update_by_pk(3, {'name': 'Nobody'}), 0)
+        
+        self.assertEqual(self.table.delete_by_pk(1), 1)
+        self.assertEqual(self.table.delete_by_pk(1), 0)
+        self.assertIsNone(self.table.get_by_pk(1))
+        
+        # Tables without a primary key have no key to look up
+        log = Table('log', [Column('message', VarChar(100))])
+        with self.assertRaises(ValueError):
+            log.get_by_pk(1)
+    
+    def test_max_value(self):
+        self.assertIsNone(self.table.max_value('id'))
+        self.table.insert({'id': 2, 'name': 'Bob'})
+        self.table.insert({'id': 7, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 3, 'name': 'Carol'})
+        self.assertEqual(self.table.max_value('id'), 7)
+        self.assertEqual(self.table.max_value('name'), 'Carol')
+        self.assertEqual(self.table.max_value('email'), 'alice@test.com')
+        
+        # Deleted rows no longer count, indexed or not
+        self.table.delete_by_pk(3)
+        self.assertEqual(self.table.max_value('name'), 'Bob')
+        self.table.delete_by_pk(7)
+        self.assertEqual(self.table.max_value('id'), 2)
+        
+        with self.assertRaises(ValueError):
+            self.table.max_value('age')
+    
+    def test_next_pk(self):
+        self.assertEqual(self.table.next_pk(), 1)
+        self.table.insert({'id': 5, 'name': 'Alice'})
+        self.table.insert_many([{'id': 2, 'name': 'Bob'}, {'id': 7, 'name': 'Carol'}])
+        self.assertEqual(self.table.next_pk(), 8)
+        
+        # Keys of deleted rows are not handed out again
+        self.table.delete_by_pk(7)
+        self.assertEqual(self.table.next_pk(), 8)
+        self.table.update_by_pk(2, {'id': 10})
+        self.assertEqual(self.table.next_pk(), 11)
+        self.assertEqual(self.table.max_pk, 10)
+        
+        # Restoring a saved maximum only ever raises it
+        self.table.note_max_pk(20)
+        self.table.note_max_pk(15)
+        self.assertEqual(self.table.next_pk(), 21)
+        log = Table('log', [Column('message', VarChar(100))])
+        self.assertIsNone(log.max_pk)
+        with self.assertRaises(ValueError):
+            log.note_max_pk(3)
+    
+    def test_version(self):
+        version = self.table.version
+        self.table.insert({'id': 1, 'name': 'Alice'})
+        self.assertGreater(self.table.version, version)
+        
+        # Statements that change nothing leave the version alone
+        version = self.table.version
+        self.table.update_by_pk(2, {'name': 'Nobody'})
+        self.table.delete_by_pk(2)
+        self.assertEqual(self.table.version, version)
+        
+        self.table.update_by_pk(1, {'name': 'Alice Smith'})
+        self.assertGreater(self.table.version, version)
+        version = self.table.version
+        self.table.delete_by_pk(1)
+        self.assertGreater(self.table.version, version)
+    
+    def test_columnar_storage(self):
+        self.table.insert({'id': 1, 'name': 'Alice', 'email': 'alice@test.com'})
+        self.table.insert({'id': 2, 'name': 'Bob'})
+        self.table.insert({'id': 3, 'name': 'Carol', 'email': 'carol@test.com'})
+        
+        self.table.delete(where=lambda row: row['id'] == 2)
+        self.assertEqual(self.table.row_count, 2)
+        self.assertEqual(len(self.table.columns_data['id']), 3)
+        self.assertEqual(self.table.rows[1], {'id': 3, 'name': 'Carol', 'email': 'carol@test.com'})
+        
+        # Row IDs are stable across deletes
+        self.assertEqual(self.table.indexes['id'].lookup(3), {2})
+        self.assertEqual(self.table.indexes['id'].lookup(2), set())
+        self.assertEqual(self.table.insert({'id': 4, 'name': 'Dave'}), 3)
+        
+        # Once most slots are tombstones the storage is compacted
+        self.table.delete(where=Predicate('id', '<', 4))
+        self.assertEqual(self.table.columns_data['id'], [4])
+        self.assertEqual(self.table.deleted, set())
+        self.assertEqual(self.table.indexes['id'].lookup(4), {0})
+        self.assertEqual(self.table.insert({'id': 5, 'name': 'Erin'}), 1)
+    
     def test_index(self):
         # Primary key index should be created automatically
         self.assertIn('id', self.table.indexes)
@@ -89,6 +334,35 @@ class TestTable(unittest.TestCase):
         # Create a new index
         self.table.create_index('name')
         self.assertIn('name', self.table.indexes)
+        
+        # Indexes created later also enforce uniqueness
+        self.table.insert({'id': 1, 'name': 'Alice'})
+        self.table.create_index('name', unique=True)
+        with self.assertRaises(ValueError):
+            self.table.insert({'id': 2, 'name': 'Alice'})
+        with self.assertRaises(ValueError):
+            self.table.insert_many([{'id': 3, 'name': 'Alice'}])
+    
+    def test_indexed_equality(self):
+        for i in range(1, 5):
+            self.table.insert({'id': i, 'name': f'User {i % 2}', 'email': f'u{i}@example.com'})
+        self.table.create_index('name')
+        
+        # Equality on an indexed column is answered from the index
+        rows = self.table.select(columns=['id'], where=Predicate('name', '=', 'User 1'))
+        self.assertEqual(rows, [{'id': 1}, {'id': 3}])
+        self.assertIn('User 1', self.table.indexes['name'])
+        self.assertNotIn('User 2', self.table.indexes['name'])
+        
+        # Lookups return frozen copies, not the index's own sets
+        row_ids = self.table.indexes['name'].lookup('User 1')
+        self.assertEqual(row_ids, {0, 2})
+        self.assertIsInstance(row_ids, frozenset)
+        
+        self.assertEqual(self.table.update({'name': 'Carol'}, where=Predicate('id', '=', 3)), 1)
+        self.assertEqual(row_ids, {0, 2})
+        self.assertEqual(self.table.delete(where=Predicate('name', '=', 'Carol')), 1)
+        self.assertEqual(self.table.select(where=Predicate('id', '=', 3)), [])
 
 
 if __name__ == '__main__':
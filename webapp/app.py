@@ -2,8 +2,12 @@
 Task Management Web Application using the custom RDBMS.
 """
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from jinja2 import FileSystemBytecodeCache
+import atexit
 import os
 import sys
+import threading
+from itertools import islice
 
 # Add parent directory to path to import rdbms
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -13,12 +17,32 @@ from datetime import date
 
 app = Flask(__name__)
 app.secret_key = 'dev-secret-key-change-in-production'
+# Outside debug mode templates are not re-checked on disk for every
+# render; their compiled bytecode is also kept across restarts
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
 
 # Initialize database
 DB_FILE = 'taskmanager.db.json'
 db = None
 parser = None
 
+# Writes from the web routes are coalesced: a mutation marks the database
+# dirty and it is saved once this many seconds later
+SAVE_DELAY = 0.2
+# Delay before retrying a save that failed
+SAVE_RETRY_DELAY = 5.0
+# Held while saving and while routes change the database, so a save never
+# sees a half-applied change
+_save_lock = threading.Lock()
+_save_timer = None
+_dirty = False
+
+# Rows of the users and projects tables for form dropdowns, cached as
+# table name -> (table, table version, rows)
+_dropdown_cache = {}
+# Home page context, with the (table, version) pairs it was built from
+_dashboard_cache = {'generation': None, 'context': None}
+
 
 def init_database():
     """Initialize or load the database."""
@@ -93,25 +117,90 @@ def init_database():
 
 
 def save_database():
-    """Save database to file."""
-    db.save(DB_FILE)
+    """Save database to file now.
+    
+    If the save fails the database stays dirty, a retry is scheduled and
+    the error is raised to the caller.
+    """
+    global _dirty, _save_timer
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        _dirty = True
+        try:
+            db.save(DB_FILE)
+        except Exception:
+            _schedule_save(SAVE_RETRY_DELAY)
+            raise
+        _dirty = False
+
+
+def _schedule_save(delay):
+    """Start the save timer unless one is pending; needs _save_lock held."""
+    global _save_timer
+    if _save_timer is None:
+        _save_timer = threading.Timer(delay, flush_database)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def mark_dirty():
+    """Schedule a save, coalescing changes made within SAVE_DELAY seconds."""
+    global _dirty
+    with _save_lock:
+        _dirty = True
+        _schedule_save(SAVE_DELAY)
+
+
+def flush_database():
+    """Save database to file if it changed since the last save.
+    
+    Runs on the save timer's thread (or at exit), where an exception would
+    go unseen, so failures are logged; save_database() schedules the retry.
+    """
+    if _dirty:
+        try:
+            save_database()
+        except Exception:
+            app.logger.exception("Saving the database failed; retrying in %s seconds", SAVE_RETRY_DELAY)
+
+
+atexit.register(flush_database)
+
+
+def dropdown_rows(table_name):
+    """All rows of a table, re-selected only after the table has changed."""
+    table = db.get_table(table_name)
+    cached = _dropdown_cache.get(table_name)
+    if cached is None or cached[0] is not table or cached[1] != table.version:
+        cached = (table, table.version, table.select())
+        _dropdown_cache[table_name] = cached
+    return cached[2]
+
+
+def dashboard_context():
+    """Totals and recent tasks for the home page, rebuilt only after a change."""
+    tables = [db.get_table(name) for name in ('users', 'projects', 'tasks')]
+    generation = [(table, table.version) for table in tables]
+    if _dashboard_cache['generation'] != generation:
+        users, projects, tasks = tables
+        _dashboard_cache['context'] = {
+            'total_users': len(users),
+            'total_projects': len(projects),
+            'total_tasks': len(tasks),
+            # Only the first few tasks are shown, so only those are built
+            'tasks': list(islice(tasks.rows, 5)),
+        }
+        _dashboard_cache['generation'] = generation
+    return _dashboard_cache['context']
 
 
 # Routes
 @app.route('/')
 def index():
     """Home page showing overview."""
-    users = db.get_table('users').select()
-    projects = db.get_table('projects').select()
-    tasks = db.get_table('tasks').select()
-    
-    return render_template('index.html', 
-                         users=users, 
-                         projects=projects, 
-                         tasks=tasks,
-                         total_users=len(users),
-                         total_projects=len(projects),
-                         total_tasks=len(tasks))
+    return render_template('index.html', **dashboard_context())
 
 
 @app.route('/users')
@@ -126,18 +215,16 @@ def new_user():
     """Create a new user."""
     if request.method == 'POST':
         try:
+            form = request.form
             users_table = db.get_table('users')
-            # Get next ID
-            existing_users = users_table.select()
-            next_id = max([u['id'] for u in existing_users], default=0) + 1
-            
-            users_table.insert({
-                'id': next_id,
-                'username': request.form['username'],
-                'email': request.form['email'],
-                'created_at': date.today()
-            })
-            save_database()
+            with _save_lock:
+                users_table.insert({
+                    'id': users_table.next_pk(),
+                    'username': form['username'],
+                    'email': form['email'],
+                    'created_at': date.today()
+                })
+            mark_dirty()
             flash('User created successfully!', 'success')
             return redirect(url_for('list_users'))
         except Exception as e:
@@ -153,25 +240,24 @@ def edit_user(user_id):
     
     if request.method == 'POST':
         try:
-            users_table.update(
-                {
-                    'username': request.form['username'],
-                    'email': request.form['email']
-                },
-                where=lambda row: row['id'] == user_id
-            )
-            save_database()
+            form = request.form
+            with _save_lock:
+                users_table.update_by_pk(user_id, {
+                    'username': form['username'],
+                    'email': form['email']
+                })
+            mark_dirty()
             flash('User updated successfully!', 'success')
             return redirect(url_for('list_users'))
         except Exception as e:
             flash(f'Error: {str(e)}', 'error')
     
-    users = users_table.select(where=lambda row: row['id'] == user_id)
-    if not users:
+    user = users_table.get_by_pk(user_id)
+    if user is None:
         flash('User not found', 'error')
         return redirect(url_for('list_users'))
     
-    return render_template('user_form.html', user=users[0])
+    return render_template('user_form.html', user=user)
 
 
 @app.route('/users/<int:user_id>/delete', methods=['POST'])
@@ -179,9 +265,10 @@ def delete_user(user_id):
     """Delete a user."""
     try:
         users_table = db.get_table('users')
-        count = users_table.delete(where=lambda row: row['id'] == user_id)
+        with _save_lock:
+            count = users_table.delete_by_pk(user_id)
         if count > 0:
-            save_database()
+            mark_dirty()
             flash('User deleted successfully!', 'success')
         else:
             flash('User not found', 'error')
@@ -194,30 +281,30 @@ def delete_user(user_id):
 @app.route('/projects')
 def list_projects():
     """List all projects."""
-    # Join projects with users to get owner names
-    projects = db.join('projects', 'users', 'owner_id', 'id', join_type='left')
-    return render_template('projects.html', projects=projects)
+    # Owner names come from an id -> username dict rather than a join
+    projects = db.get_table('projects').select()
+    owner_names = dict(db.get_table('users').select_columns(['id', 'username']))
+    return render_template('projects.html', projects=projects, owner_names=owner_names)
 
 
 @app.route('/projects/new', methods=['GET', 'POST'])
 def new_project():
     """Create a new project."""
-    users = db.get_table('users').select()
+    users = dropdown_rows('users')
     
     if request.method == 'POST':
         try:
+            form = request.form
             projects_table = db.get_table('projects')
-            existing_projects = projects_table.select()
-            next_id = max([p['id'] for p in existing_projects], default=0) + 1
-            
-            projects_table.insert({
-                'id': next_id,
-                'name': request.form['name'],
-                'description': request.form['description'],
-                'owner_id': int(request.form['owner_id']),
-                'created_at': date.today()
-            })
-            save_database()
+            with _save_lock:
+                projects_table.insert({
+                    'id': projects_table.next_pk(),
+                    'name': form['name'],
+                    'description': form['description'],
+                    'owner_id': int(form['owner_id']),
+                    'created_at': date.today()
+                })
+            mark_dirty()
             flash('Project created successfully!', 'success')
             return redirect(url_for('list_projects'))
         except Exception as e:
@@ -230,30 +317,29 @@ def new_project():
 def edit_project(project_id):
     """Edit a project."""
     projects_table = db.get_table('projects')
-    users = db.get_table('users').select()
+    users = dropdown_rows('users')
     
     if request.method == 'POST':
         try:
-            projects_table.update(
-                {
-                    'name': request.form['name'],
-                    'description': request.form['description'],
-                    'owner_id': int(request.form['owner_id'])
-                },
-                where=lambda row: row['id'] == project_id
-            )
-            save_database()
+            form = request.form
+            with _save_lock:
+                projects_table.update_by_pk(project_id, {
+                    'name': form['name'],
+                    'description': form['description'],
+                    'owner_id': int(form['owner_id'])
+                })
+            mark_dirty()
             flash('Project updated successfully!', 'success')
             return redirect(url_for('list_projects'))
         except Exception as e:
             flash(f'Error: {str(e)}', 'error')
     
-    projects = projects_table.select(where=lambda row: row['id'] == project_id)
-    if not projects:
+    project = projects_table.get_by_pk(project_id)
+    if project is None:
         flash('Project not found', 'error')
         return redirect(url_for('list_projects'))
     
-    return render_template('project_form.html', project=projects[0], users=users)
+    return render_template('project_form.html', project=project, users=users)
 
 
 @app.route('/projects/<int:project_id>/delete', methods=['POST'])
@@ -261,9 +347,10 @@ def delete_project(project_id):
     """Delete a project."""
     try:
         projects_table = db.get_table('projects')
-        count = projects_table.delete(where=lambda row: row['id'] == project_id)
+        with _save_lock:
+            count = projects_table.delete_by_pk(project_id)
         if count > 0:
-            save_database()
+            mark_dirty()
             flash('Project deleted successfully!', 'success')
         else:
             flash('Project not found', 'error')
@@ -276,56 +363,46 @@ def delete_project(project_id):
 @app.route('/tasks')
 def list_tasks():
     """List all tasks."""
-    # Get all tasks and related data
+    # Get all tasks, and the project and user names they refer to
     tasks = db.get_table('tasks').select()
-    projects = {p['id']: p for p in db.get_table('projects').select()}
-    users = {u['id']: u for u in db.get_table('users').select()}
-    
-    # Enrich tasks with project and user names
-    enriched_tasks = []
-    for task in tasks:
-        enriched = task.copy()
-        enriched['project_name'] = projects.get(task['project_id'], {}).get('name', 'Unknown')
-        enriched['assigned_to_name'] = users.get(task['assigned_to'], {}).get('username', 'Unassigned')
-        enriched_tasks.append(enriched)
+    project_names = dict(db.get_table('projects').select_columns(['id', 'name']))
+    user_names = dict(db.get_table('users').select_columns(['id', 'username']))
     
-    return render_template('tasks.html', tasks=enriched_tasks)
+    return render_template('tasks.html', tasks=tasks,
+                         project_names=project_names,
+                         user_names=user_names)
 
 
 @app.route('/tasks/new', methods=['GET', 'POST'])
 def new_task():
     """Create a new task."""
-    projects = db.get_table('projects').select()
-    users = db.get_table('users').select()
+    projects = dropdown_rows('projects')
+    users = dropdown_rows('users')
     
     if request.method == 'POST':
         try:
+            form = request.form
             tasks_table = db.get_table('tasks')
-            existing_tasks = tasks_table.select()
-            next_id = max([t['id'] for t in existing_tasks], default=0) + 1
-            
-            due_date_str = request.form.get('due_date')
-            due_date = None
-            if due_date_str:
-                parts = due_date_str.split('-')
-                due_date = date(int(parts[0]), int(parts[1]), int(parts[2]))
+            due_date_str = form.get('due_date')
+            due_date = date.fromisoformat(due_date_str) if due_date_str else None
             
-            assigned_to = request.form.get('assigned_to')
+            assigned_to = form.get('assigned_to')
             assigned_to = int(assigned_to) if assigned_to else None
             
-            tasks_table.insert({
-                'id': next_id,
-                'title': request.form['title'],
-                'description': request.form['description'],
-                'project_id': int(request.form['project_id']),
-                'assigned_to': assigned_to,
-                'status': request.form['status'],
-                'priority': request.form['priority'],
-                'completed': request.form.get('completed') == 'on',
-                'due_date': due_date,
-                'created_at': date.today()
-            })
-            save_database()
+            with _save_lock:
+                tasks_table.insert({
+                    'id': tasks_table.next_pk(),
+                    'title': form['title'],
+                    'description': form['description'],
+                    'project_id': int(form['project_id']),
+                    'assigned_to': assigned_to,
+                    'status': form['status'],
+                    'priority': form['priority'],
+                    'completed': form.get('completed') == 'on',
+                    'due_date': due_date,
+                    'created_at': date.today()
+                })
+            mark_dirty()
             flash('Task created successfully!', 'success')
             return redirect(url_for('list_tasks'))
         except Exception as e:
@@ -338,45 +415,40 @@ def new_task():
 def edit_task(task_id):
     """Edit a task."""
     tasks_table = db.get_table('tasks')
-    projects = db.get_table('projects').select()
-    users = db.get_table('users').select()
+    projects = dropdown_rows('projects')
+    users = dropdown_rows('users')
     
     if request.method == 'POST':
         try:
-            due_date_str = request.form.get('due_date')
-            due_date = None
-            if due_date_str:
-                parts = due_date_str.split('-')
-                due_date = date(int(parts[0]), int(parts[1]), int(parts[2]))
+            form = request.form
+            due_date_str = form.get('due_date')
+            due_date = date.fromisoformat(due_date_str) if due_date_str else None
             
-            assigned_to = request.form.get('assigned_to')
+            assigned_to = form.get('assigned_to')
             assigned_to = int(assigned_to) if assigned_to else None
             
-            tasks_table.update(
-                {
-                    'title': request.form['title'],
-                    'description': request.form['description'],
-                    'project_id': int(request.form['project_id']),
+            with _save_lock:
+                tasks_table.update_by_pk(task_id, {
+                    'title': form['title'],
+                    'description': form['description'],
+                    'project_id': int(form['project_id']),
                     'assigned_to': assigned_to,
-                    'status': request.form['status'],
-                    'priority': request.form['priority'],
-                    'completed': request.form.get('completed') == 'on',
+                    'status': form['status'],
+                    'priority': form['priority'],
+                    'completed': form.get('completed') == 'on',
                     'due_date': due_date
-                },
-                where=lambda row: row['id'] == task_id
-            )
-            save_database()
+                })
+            mark_dirty()
             flash('Task updated successfully!', 'success')
             return redirect(url_for('list_tasks'))
         except Exception as e:
             flash(f'Error: {str(e)}', 'error')
     
-    tasks = tasks_table.select(where=lambda row: row['id'] == task_id)
-    if not tasks:
+    task = tasks_table.get_by_pk(task_id)
+    if task is None:
         flash('Task not found', 'error')
         return redirect(url_for('list_tasks'))
     
-    task = tasks[0]
     if task['due_date']:
         task['due_date_str'] = task['due_date'].isoformat()
     
@@ -388,9 +460,10 @@ def delete_task(task_id):
     """Delete a task."""
     try:
         tasks_table = db.get_table('tasks')
-        count = tasks_table.delete(where=lambda row: row['id'] == task_id)
+        with _save_lock:
+            count = tasks_table.delete_by_pk(task_id)
         if count > 0:
-            save_database()
+            mark_dirty()
             flash('Task deleted successfully!', 'success')
         else:
             flash('Task not found', 'error')
@@ -409,7 +482,8 @@ def sql_console():
     if request.method == 'POST':
         sql = request.form.get('sql', '')
         try:
-            result = parser.execute(sql)
+            with _save_lock:
+                result = parser.execute(sql)
             save_database()
         except Exception as e:
             error = str(e)
@@ -419,4 +493,5 @@ def sql_console():
 
 if __name__ == '__main__':
     init_database()
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Debug mode (reloader, template auto-reload) is opt-in: FLASK_DEBUG=1
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)